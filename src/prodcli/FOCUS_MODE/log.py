@@ -0,0 +1,35 @@
+# FOCUS_MODE/log.py
+import json
+import os
+from datetime import datetime
+
+LOG_FILE = "src/data/focus_log.jsonl"
+
+def append_focus_log(duration_minutes: int):
+    """Appends one focus-session record as a JSON line."""
+    now = datetime.now()
+    entry = {
+        "ts": now.isoformat(),
+        "date": now.date().isoformat(),
+        "duration_minutes": int(duration_minutes),
+    }
+    with open(LOG_FILE, "a") as f:
+        f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+def get_today_sessions():
+    """Returns (count, total_minutes) for sessions logged today."""
+    if not os.path.exists(LOG_FILE):
+        return 0, 0
+
+    today = datetime.now().date().isoformat()
+    count = 0
+    total_minutes = 0
+    with open(LOG_FILE, "r") as f:
+        for line in f:
+            if today not in line:
+                continue
+            log = json.loads(line)
+            if log.get("date") == today:
+                count += 1
+                total_minutes += log["duration_minutes"]
+    return count, total_minutes
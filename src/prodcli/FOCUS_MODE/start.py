@@ -2,22 +2,27 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.live import Live
 from rich.text import Text
+import signal
+import threading
 import time
 import os
 import platform
-from datetime import datetime
 import typer
-import json
-from pathlib import Path
+from prodcli.FOCUS_MODE.log import append_focus_log
 
 focus_app = typer.Typer()
 
-def play_sound():
+def _beep():
     if platform.system() == "Windows":
         import winsound
         winsound.Beep(1000, 500)
     else:
-        print('\a') 
+        print('\a')
+
+def play_sound():
+    # winsound.Beep blocks for the beep's full duration, which would stall
+    # the Live timer for half a second; sound it from a daemon thread.
+    threading.Thread(target=_beep, daemon=True).start()
 
 MOTIVATIONAL_QUOTES = [
     "Stay focused and keep coding.",
@@ -26,8 +31,10 @@ MOTIVATIONAL_QUOTES = [
     "Discipline is the bridge between goals and accomplishment."
 ]
 
+NUM_QUOTES = len(MOTIVATIONAL_QUOTES)
+
 def get_quote(seconds_left):
-    index = (seconds_left // 60) % len(MOTIVATIONAL_QUOTES)
+    index = (seconds_left // 60) % NUM_QUOTES
     return MOTIVATIONAL_QUOTES[index]
 
 @focus_app.command()
@@ -52,62 +59,71 @@ def start(
     console.print(Text(f"🔔 Starting {hours}h {minutes}m focus session...", style="bold green"))
 
     seconds_passed = 0
-    with Live(refresh_per_second=4) as live:
-        while seconds_passed < total_seconds:
-            remaining = total_seconds - seconds_passed
-            mins, secs = divmod(remaining, 60)
-            hrs, mins = divmod(mins, 60)
-            time_str = f"{hrs:02}:{mins:02}:{secs:02}"
-            quote = get_quote(remaining)
-            timer_text = f"⏳ [bold magenta]{time_str}[/bold magenta]\n[italic yellow]{quote}[/italic yellow]"
-            panel = Panel.fit(timer_text, title="🎯 Focus Mode")
-            live.update(panel)
-            time.sleep(1)
-            seconds_passed += 1
-
-            if break_every and seconds_passed % (break_every * 60) == 0 and seconds_passed < total_seconds:
-                play_sound()
-                console.print(f"\n[cyan]⏸️ Time for a {break_duration}-minute break![/cyan]")
-                
-                # Ask user to skip
-                skip = typer.confirm("❓ Do you want to skip this break?", default=False)
-                if skip:
-                    console.print("[yellow]⏭️ Skipping break... Back to work![/yellow]")
-                    continue
-
-                break_secs = break_duration * 60
-                for b in range(break_secs, 0, -1):
-                    b_min, b_sec = divmod(b, 60)
-                    b_time = f"{b_min:02}:{b_sec:02}"
-                    live.update(Panel(f"🧘 Break Time: [bold magenta]{b_time}[/bold magenta]", title="☕ Take a Break"))
-                    time.sleep(1)
-                
-                console.print("[green]✅ Break over. Back to focus![/green]")
-
-        live.update(Panel("[bold green]✅ Done! Take a longer break now.[/bold green]", title="👏 Session Complete"))
-        log_focus_session(total_seconds)
-
-LOG_FILE = Path("focus_log.json")
-
-def log_focus_session(duration_seconds):
-    now = datetime.now()
-    entry = {
-        "date": now.strftime("%Y-%m-%d"),
-        "time": now.strftime("%H:%M:%S"),
-        "duration_minutes": duration_seconds // 60
-    }
-
-    if LOG_FILE.exists():
-        with open(LOG_FILE, "r") as f:
-            logs = json.load(f)
-    else:
-        logs = []
-
-    logs.append(entry)
+    # The panel only changes once per second, so refresh at 1 Hz and drive
+    # updates explicitly; waiting on an Event against a monotonic deadline
+    # avoids drift over long sessions and, unlike time.sleep, wakes
+    # immediately on Ctrl-C instead of up to a second later.
+    stop = threading.Event()
+    previous_handler = signal.signal(signal.SIGINT, lambda *_: stop.set())
+    start_monotonic = time.monotonic()
+    # The quote only changes on minute boundaries; recompute it on
+    # transitions instead of every tick.
+    quote = None
+    prev_minute = None
+    try:
+        with Live(refresh_per_second=1, auto_refresh=False) as live:
+            while seconds_passed < total_seconds and not stop.is_set():
+                remaining = total_seconds - seconds_passed
+                mins, secs = divmod(remaining, 60)
+                hrs, mins = divmod(mins, 60)
+                time_str = f"{hrs:02}:{mins:02}:{secs:02}"
+                minute = remaining // 60
+                if minute != prev_minute:
+                    quote = get_quote(remaining)
+                    prev_minute = minute
+                timer_text = f"⏳ [bold magenta]{time_str}[/bold magenta]\n[italic yellow]{quote}[/italic yellow]"
+                panel = Panel.fit(timer_text, title="🎯 Focus Mode")
+                live.update(panel, refresh=True)
+                seconds_passed += 1
+                next_tick = start_monotonic + seconds_passed
+                if stop.wait(max(0, next_tick - time.monotonic())):
+                    break
+
+                if break_every and seconds_passed % (break_every * 60) == 0 and seconds_passed < total_seconds:
+                    play_sound()
+                    console.print(f"\n[cyan]⏸️ Time for a {break_duration}-minute break![/cyan]")
+
+                    # Ask user to skip
+                    skip = typer.confirm("❓ Do you want to skip this break?", default=False)
+                    if skip:
+                        console.print("[yellow]⏭️ Skipping break... Back to work![/yellow]")
+                        start_monotonic = time.monotonic() - seconds_passed
+                        continue
+
+                    break_secs = break_duration * 60
+                    for b in range(break_secs, 0, -1):
+                        b_min, b_sec = divmod(b, 60)
+                        b_time = f"{b_min:02}:{b_sec:02}"
+                        live.update(Panel(f"🧘 Break Time: [bold magenta]{b_time}[/bold magenta]", title="☕ Take a Break"), refresh=True)
+                        if stop.wait(1):
+                            break
+                    if stop.is_set():
+                        break
+
+                    console.print("[green]✅ Break over. Back to focus![/green]")
+                    # The break (and the confirm prompt) paused the session, so
+                    # re-anchor the tick schedule before resuming the countdown.
+                    start_monotonic = time.monotonic() - seconds_passed
+
+            if stop.is_set():
+                live.update(Panel("[bold yellow]⏹️ Session interrupted.[/bold yellow]", title="🎯 Focus Mode"), refresh=True)
+            else:
+                live.update(Panel("[bold green]✅ Done! Take a longer break now.[/bold green]", title="👏 Session Complete"), refresh=True)
+                append_focus_log(total_seconds // 60)
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
 
-    with open(LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=4)
 
 
 if __name__ == "__main__":
-    focus_app()
\ No newline at end of file
+    focus_app()
@@ -1,39 +1,12 @@
 import typer
-import datetime
-import json
-import os
 
+from prodcli.FOCUS_MODE.log import append_focus_log, get_today_sessions
 
-stats_app = typer.Typer()
 
-LOG_FILE = "src/data/focus_log.json"
+stats_app = typer.Typer()
 
 def log_session(duration: int):
-    now = datetime.datetime.now().isoformat()
-    data = {"timestamp": now, "duration_minutes": duration}
-    
-    if os.path.exists(LOG_FILE):
-        with open(LOG_FILE, "r") as f:
-            logs = json.load(f)
-    else:
-        logs = []
-
-    logs.append(data)
-    with open(LOG_FILE, "w") as f:
-        json.dump(logs, f, indent=4)
-
-def get_today_sessions():
-    if not os.path.exists(LOG_FILE):
-        return 0, 0
-
-    with open(LOG_FILE, "r") as f:
-        logs = json.load(f)
-    
-    today = datetime.date.today().isoformat()
-    today_logs = [log for log in logs if log["date"] == today]
-    count = len(today_logs)
-    total_minutes = sum(log["duration_minutes"] for log in today_logs)
-    return count, total_minutes
+    append_focus_log(duration)
 
 @stats_app.command()
 def stats():
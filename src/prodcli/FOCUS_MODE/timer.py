@@ -1,11 +1,15 @@
 import time
-import sys
 
 def countdown(seconds: int):
-    while seconds:
-        mins, secs = divmod(seconds, 60)
+    # Sleeping against a monotonic deadline instead of a fixed sleep(1)
+    # keeps the display from drifting over long countdowns: each tick waits
+    # until the moment that many seconds actually remain.
+    deadline = time.monotonic() + seconds
+    remaining = seconds
+    while remaining > 0:
+        mins, secs = divmod(remaining, 60)
         timer = f"{mins:02d}:{secs:02d}"
         print(f"\r⏳ {timer}", end="")
-        time.sleep(1)
-        seconds -= 1
+        remaining -= 1
+        time.sleep(max(0.0, deadline - remaining - time.monotonic()))
     print("\r🛎️  Time's up!                        ")
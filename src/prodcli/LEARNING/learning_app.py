@@ -1,3 +1,5 @@
+import sys
+
 import typer
 from prodcli.LEARNING.problem_tracker import add_problem, list_problems, update_problem, open_problem_in_browser, get_problem_stats
 from rich.console import Console
@@ -10,6 +12,22 @@ from rich import box
 learning_app = typer.Typer()
 console = Console()
 
+# Built once at import; the list command would otherwise allocate fresh
+# Style objects for every row.
+_STATUS_STYLES = {
+    "Solved": Style(color="green", bold=True),
+    "Attempted": Style(color="bright_cyan", bold=True),
+    "Revisit": Style(color="bright_yellow", bold=True),
+    "Unsolved": Style(color="red", bold=True),
+}
+_DIFFICULTY_STYLES = {
+    "Easy": Style(color="green"),
+    "Medium": Style(color="yellow"),
+    "Hard": Style(color="red"),
+}
+_DEFAULT_STYLE = Style(color="white")
+_BOLD = Style(bold=True)
+
 @learning_app.command("add")
 def add(
     url: str = typer.Option(..., "--url", "-u", help="Direct URL to the problem (e.g., LeetCode, GfG)."),
@@ -50,6 +68,25 @@ def list_problems_command(
         console.print("[yellow]No problems found matching your criteria.[/yellow]")
         return
 
+    if not console.is_terminal:
+        # Piped/redirected output: plain TSV is both cheaper than table
+        # layout and far easier for grep/cut to consume.
+        sys.stdout.write("#\tPlatform\tName\tDifficulty\tStatus\tAdded Date\tLast Modified\tTags\tURL\tNotes\n")
+        for i, p in enumerate(problems):
+            sys.stdout.write("\t".join((
+                str(i + 1),
+                p['platform'],
+                p['name'],
+                p['difficulty'],
+                p['status'],
+                p.get('added_date', 'N/A').split('T')[0] if p.get('added_date') else 'N/A',
+                p.get('last_modified_date', 'N/A').split('T')[0] if p.get('last_modified_date') else 'N/A',
+                ", ".join(p.get('tags', [])) or "N/A",
+                p.get('url') or "N/A",
+                p.get('notes') or "N/A",
+            )) + "\n")
+        return
+
     table = Table(
         title="[bold deep_sky_blue1]Your Coding Problems[/bold deep_sky_blue1]",
         show_header=True,
@@ -72,27 +109,8 @@ def list_problems_command(
 
 
     for i, p in enumerate(problems):
-        status_style: Style
-        if p['status'] == 'Solved':
-            status_style = Style(color="green", bold=True)
-        elif p['status'] == 'Attempted':
-            status_style = Style(color="bright_cyan", bold=True)
-        elif p['status'] == 'Revisit':
-            status_style = Style(color="bright_yellow", bold=True)
-        elif p['status'] == 'Unsolved':
-            status_style = Style(color="red", bold=True)
-        else:
-            status_style = Style(color="white") # Default
-
-        difficulty_style: Style
-        if p['difficulty'] == 'Easy':
-            difficulty_style = Style(color="green")
-        elif p['difficulty'] == 'Medium':
-            difficulty_style = Style(color="yellow")
-        elif p['difficulty'] == 'Hard':
-            difficulty_style = Style(color="red")
-        else:
-            difficulty_style = Style(color="white") # Default
+        status_style = _STATUS_STYLES.get(p['status'], _DEFAULT_STYLE)
+        difficulty_style = _DIFFICULTY_STYLES.get(p['difficulty'], _DEFAULT_STYLE)
 
         added_date = p.get('added_date', 'N/A').split('T')[0] if p.get('added_date') else 'N/A'
         last_modified = p.get('last_modified_date', 'N/A').split('T')[0] if p.get('last_modified_date') else 'N/A'
@@ -105,13 +123,13 @@ def list_problems_command(
         table.add_row(
             str(i + 1),
             p['platform'],
-            Text(p['name'], style=Style(bold=True)), 
+            Text(p['name'], style=_BOLD), 
             Text(p['difficulty'], style=difficulty_style),
             Text(p['status'], style=status_style),
             added_date,
             last_modified,
             tags_str,
-            f"[link={p['url']}]Link[/link]" if p.get('url') else "N/A",
+            Text("Link", style=Style(link=p['url'])) if p.get('url') else "N/A",
             notes_snippet
         )
 
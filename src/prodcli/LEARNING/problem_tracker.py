@@ -1,26 +1,81 @@
 import json
 import os
 import webbrowser
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime
 
 DATA_FILE = "src/data/problems.json"
 
 os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
 
+# Parsed file cached for the life of the process, keyed on the file's
+# mtime so an external edit is still picked up. Commands that read after
+# a mutation (or chain several reads) re-parse nothing.
+_CACHE = None
+_CACHE_MTIME = -1
+
+# Lowercased name -> list index, rebuilt whenever the cache refreshes, so
+# the by-name commands resolve in one dict hit instead of a scan. On
+# duplicate names the first occurrence wins, matching the old scan order.
+_NAME_INDEX = {}
+
+def _build_name_index(problems):
+    index = {}
+    for i, problem in enumerate(problems):
+        index.setdefault(problem['name'].lower(), i)
+    return index
+
+# Inverted indexes for the list filters, keyed by lowercased value and
+# rebuilt alongside the cache; filtered listings intersect index sets
+# instead of scanning and re-lowercasing every record.
+_BY_PLATFORM = {}
+_BY_STATUS = {}
+_BY_TAG = {}
+
+def _build_filter_indexes(problems):
+    by_platform, by_status, by_tag = {}, {}, {}
+    for i, problem in enumerate(problems):
+        by_platform.setdefault(problem['platform'].lower(), set()).add(i)
+        by_status.setdefault(problem['status'].lower(), set()).add(i)
+        for tag in problem.get('tags', []):
+            by_tag.setdefault(tag.lower(), set()).add(i)
+    return by_platform, by_status, by_tag
+
+def _refresh_indexes(problems):
+    global _NAME_INDEX, _BY_PLATFORM, _BY_STATUS, _BY_TAG
+    _NAME_INDEX = _build_name_index(problems)
+    _BY_PLATFORM, _BY_STATUS, _BY_TAG = _build_filter_indexes(problems)
+
+def _file_mtime():
+    try:
+        return os.stat(DATA_FILE).st_mtime_ns
+    except OSError:
+        return -1
+
 def _load_problems():
-    if os.path.exists(DATA_FILE):
+    global _CACHE, _CACHE_MTIME
+    mtime = _file_mtime()
+    if _CACHE is not None and mtime == _CACHE_MTIME:
+        return _CACHE
+    problems = []
+    if mtime != -1:
         try:
             with open(DATA_FILE, 'r') as f:
-                return json.load(f)
+                problems = json.load(f)
         except json.JSONDecodeError:
             print(f"Warning: {DATA_FILE} is empty or corrupted. Starting with empty list.")
-            return []
-    return []
+    _CACHE = problems
+    _CACHE_MTIME = mtime
+    _refresh_indexes(problems)
+    return problems
 
 def _save_problems(problems):
+    global _CACHE, _CACHE_MTIME
     with open(DATA_FILE, 'w') as f:
         json.dump(problems, f, indent=4)
+    _CACHE = problems
+    _CACHE_MTIME = _file_mtime()
+    _refresh_indexes(problems)
 
 def add_problem(platform, url, name, difficulty, status, notes, tags_str):
     problems = _load_problems()
@@ -40,58 +95,51 @@ def add_problem(platform, url, name, difficulty, status, notes, tags_str):
 
 def list_problems(platform=None, status=None, tag=None):
     problems = _load_problems()
-    filtered_problems = []
-    for problem in problems:
-        match = True
-        if platform and problem['platform'].lower() != platform.lower():
-            match = False
-        if status and problem['status'].lower() != status.lower():
-            match = False
-        if tag and tag.lower() not in [t.lower() for t in problem.get('tags', [])]:
-            match = False
-        if match:
-            filtered_problems.append(problem)
-    return filtered_problems
+    matched = None
+    if platform is not None:
+        matched = set(_BY_PLATFORM.get(platform.lower(), ()))
+    if status is not None:
+        hits = _BY_STATUS.get(status.lower(), set())
+        matched = hits.copy() if matched is None else matched & hits
+    if tag is not None:
+        hits = _BY_TAG.get(tag.lower(), set())
+        matched = hits.copy() if matched is None else matched & hits
+    if matched is None:
+        return problems
+    return [problems[i] for i in sorted(matched)]
 
 def update_problem(name, new_status=None, new_notes=None, new_difficulty=None, new_tags_str=None):
     problems = _load_problems()
-    found = False
-    for problem in problems:
-        if problem['name'].lower() == name.lower():
-            if new_status:
-                problem['status'] = new_status
-            if new_notes is not None: # Allow empty string to clear notes
-                problem['notes'] = new_notes
-            if new_difficulty:
-                problem['difficulty'] = new_difficulty
-            if new_tags_str is not None:
-                problem['tags'] = [t.strip() for t in new_tags_str.split(',') if t.strip()] if new_tags_str else []
-            # Optionally update last_modified_date
-            problem['last_modified_date'] = datetime.now().isoformat()
-            found = True
-            break
-    if found:
-        _save_problems(problems)
-    return found
+    idx = _NAME_INDEX.get(name.lower())
+    if idx is None:
+        return False
+    problem = problems[idx]
+    if new_status:
+        problem['status'] = new_status
+    if new_notes is not None: # Allow empty string to clear notes
+        problem['notes'] = new_notes
+    if new_difficulty:
+        problem['difficulty'] = new_difficulty
+    if new_tags_str is not None:
+        problem['tags'] = [t.strip() for t in new_tags_str.split(',') if t.strip()] if new_tags_str else []
+    # Optionally update last_modified_date
+    problem['last_modified_date'] = datetime.now().isoformat()
+    _save_problems(problems)
+    return True
 
 def open_problem_in_browser(name):
     problems = _load_problems()
-    for problem in problems:
-        if problem['name'].lower() == name.lower() and problem.get('url'):
-            webbrowser.open(problem['url'])
-            return True
+    idx = _NAME_INDEX.get(name.lower())
+    if idx is not None and problems[idx].get('url'):
+        webbrowser.open(problems[idx]['url'])
+        return True
     return False
 
 def get_problem_stats():
     problems = _load_problems()
-    stats = {
+    return {
         "total_problems": len(problems),
-        "problems_by_platform": defaultdict(int),
-        "problems_by_status": defaultdict(int),
-        "problems_by_difficulty": defaultdict(int),
-    }
-    for problem in problems:
-        stats['problems_by_platform'][problem['platform']] += 1
-        stats['problems_by_status'][problem['status']] += 1
-        stats['problems_by_difficulty'][problem['difficulty']] += 1
-    return stats
\ No newline at end of file
+        "problems_by_platform": Counter(p['platform'] for p in problems),
+        "problems_by_status": Counter(p['status'] for p in problems),
+        "problems_by_difficulty": Counter(p['difficulty'] for p in problems),
+    }
\ No newline at end of file
@@ -1,204 +1,391 @@
 # timetrack/database.py
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from prodcli.TIMETRACK.model import Sheet, Entry
 
-DATABASE_FILE = "src/data/timetrack.db" 
+DATABASE_FILE = "src/data/timetrack.db"
+
+# One shared connection for the whole process. Opening a new connection per
+# helper call re-reads the database header and rebuilds the page cache every
+# time, which dominates the cost of these tiny queries.
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_LOCK = threading.Lock()
 
 def get_db_connection():
-    conn = sqlite3.connect(DATABASE_FILE)
-    conn.row_factory = sqlite3.Row 
-    return conn
+    global _CONN
+    if _CONN is None:
+        with _CONN_LOCK:
+            if _CONN is None:
+                conn = sqlite3.connect(DATABASE_FILE, check_same_thread=False,
+                                       isolation_level=None)
+                conn.row_factory = sqlite3.Row
+                _CONN = conn
+    return _CONN
 
-def create_tables():
+@contextmanager
+def get_cursor():
+    """Yields a cursor on the shared connection, serialized across threads."""
     conn = get_db_connection()
-    cursor = conn.cursor()
+    with _CONN_LOCK:
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
 
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sheets (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL
-        )
-    """)
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            sheet_id INTEGER NOT NULL,
-            start_time TEXT NOT NULL,
-            end_time TEXT,
-            note TEXT,
-            FOREIGN KEY (sheet_id) REFERENCES sheets (id) ON DELETE CASCADE
-        )
-    """)
-    conn.commit()
-    conn.close()
+@contextmanager
+def transaction():
+    """Yields a cursor with all statements grouped into one BEGIN IMMEDIATE/COMMIT.
+
+    The shared connection runs in autocommit mode, so multi-statement
+    operations would otherwise pay one journal fsync per statement.
+    """
+    conn = get_db_connection()
+    with _CONN_LOCK:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            yield cursor
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+
+_ENTRIES_DDL = """
+    CREATE TABLE IF NOT EXISTS entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sheet_id INTEGER NOT NULL,
+        start_time INTEGER NOT NULL,
+        end_time INTEGER,
+        note TEXT,
+        FOREIGN KEY (sheet_id) REFERENCES sheets (id) ON DELETE CASCADE
+    )
+"""
+
+# Bump whenever create_tables gains a migration step, so existing
+# databases run it once more.
+_SCHEMA_VERSION = 1
+
+def create_tables():
+    with get_cursor() as cursor:
+        # Per-connection pragmas run every start; everything below the
+        # version check does not.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-20000")
+
+        # Warm start: the stamped schema version means the tables, the
+        # legacy-timestamp migration, the indexes and ANALYZE have all
+        # already run, so skip the DDL round-trips (and the stats rescan,
+        # which grows with the entries table) entirely.
+        if cursor.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+            return
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sheets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL
+            )
+        """)
+
+        cursor.execute(_ENTRIES_DDL)
+
+        # One-time migration from the old ISO-8601 TEXT timestamps: unix
+        # seconds are a third of the bytes and read back through the C-level
+        # fromtimestamp instead of string parsing. TEXT column affinity would
+        # coerce converted values straight back to strings, so legacy
+        # databases get the table rebuilt rather than updated in place.
+        cursor.execute("PRAGMA table_info(entries)")
+        start_decl = next((row['type'] for row in cursor.fetchall()
+                           if row['name'] == 'start_time'), None)
+        if start_decl and start_decl.upper() == 'TEXT':
+            # The rebuild must be all-or-nothing: on the autocommit
+            # connection each statement would commit on its own, and a
+            # crash between the RENAME and the INSERT would leave the data
+            # stranded in entries_legacy while the next start recreates an
+            # empty entries table. (transaction() can't be used here — the
+            # surrounding get_cursor already holds the connection lock.)
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute("ALTER TABLE entries RENAME TO entries_legacy")
+                cursor.execute(_ENTRIES_DDL)
+                cursor.execute("""
+                    INSERT INTO entries (id, sheet_id, start_time, end_time, note)
+                    SELECT id, sheet_id,
+                           CAST(strftime('%s', start_time, 'utc') AS INTEGER),
+                           CASE WHEN end_time IS NULL THEN NULL
+                                ELSE CAST(strftime('%s', end_time, 'utc') AS INTEGER) END,
+                           note
+                    FROM entries_legacy
+                """)
+                cursor.execute("DROP TABLE entries_legacy")
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entries_sheet_start
+            ON entries(sheet_id, start_time DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entries_running
+            ON entries(sheet_id) WHERE end_time IS NULL
+        """)
+        cursor.execute("ANALYZE")
+        cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
 # --- Sheet Operations ---
 def insert_sheet(sheet_name: str) -> Optional[Sheet]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute("INSERT INTO sheets (name) VALUES (?)", (sheet_name,))
-        sheet_id = cursor.lastrowid
-        conn.commit()
-        return Sheet(name=sheet_name, id=sheet_id)
-    except sqlite3.IntegrityError:
-        print(f"Sheet '{sheet_name}' already exists.")
-        return get_sheet_by_name(sheet_name)
-    finally:
-        conn.close()
+    with get_cursor() as cursor:
+        try:
+            cursor.execute("INSERT INTO sheets (name) VALUES (?)", (sheet_name,))
+            return Sheet(name=sheet_name, id=cursor.lastrowid)
+        except sqlite3.IntegrityError:
+            print(f"Sheet '{sheet_name}' already exists.")
+    return get_sheet_by_name(sheet_name)
 
 def get_sheet_by_name(sheet_name: str) -> Optional[Sheet]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name FROM sheets WHERE name = ?", (sheet_name,))
-    row = cursor.fetchone()
-    conn.close()
+    with get_cursor() as cursor:
+        cursor.execute("SELECT id, name FROM sheets WHERE name = ?", (sheet_name,))
+        row = cursor.fetchone()
     return Sheet(id=row['id'], name=row['name']) if row else None
 
 def get_sheet_by_id(sheet_id: int) -> Optional[Sheet]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name FROM sheets WHERE id = ?", (sheet_id,))
-    row = cursor.fetchone()
-    conn.close()
+    with get_cursor() as cursor:
+        cursor.execute("SELECT id, name FROM sheets WHERE id = ?", (sheet_id,))
+        row = cursor.fetchone()
     return Sheet(id=row['id'], name=row['name']) if row else None
 
 def get_all_sheets() -> List[Sheet]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name FROM sheets ORDER BY name")
-    sheets = [Sheet(id=row['id'], name=row['name']) for row in cursor.fetchall()]
-    conn.close()
-    return sheets
+    with get_cursor() as cursor:
+        cursor.execute("SELECT id, name FROM sheets ORDER BY name")
+        return [Sheet(id=row['id'], name=row['name']) for row in cursor.fetchall()]
 
 # --- Entry Operations ---
 def insert_entry(entry: Entry) -> Entry:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "INSERT INTO entries (sheet_id, start_time, end_time, note) VALUES (?, ?, ?, ?)",
-        (entry.sheet_id, entry.start_time.isoformat(),
-         entry.end_time.isoformat() if entry.end_time else None, entry.note)
-    )
-    entry.id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    with get_cursor() as cursor:
+        cursor.execute(
+            "INSERT INTO entries (sheet_id, start_time, end_time, note) VALUES (?, ?, ?, ?)",
+            (entry.sheet_id, int(entry.start_time.timestamp()),
+             int(entry.end_time.timestamp()) if entry.end_time else None, entry.note)
+        )
+        entry.id = cursor.lastrowid
     return entry
 
+def bulk_insert_entries(entries: List[Entry]) -> List[int]:
+    """Inserts many entries inside one transaction and returns their new ids.
+
+    sqlite3 does not allow executemany with RETURNING, so rows are inserted
+    one execute at a time — still a single BEGIN IMMEDIATE/COMMIT, which is
+    what actually matters for write throughput.
+    """
+    rows = [
+        (entry.sheet_id, int(entry.start_time.timestamp()),
+         int(entry.end_time.timestamp()) if entry.end_time else None, entry.note)
+        for entry in entries
+    ]
+    new_ids = []
+    with transaction() as cursor:
+        for row in rows:
+            cursor.execute(
+                "INSERT INTO entries (sheet_id, start_time, end_time, note) "
+                "VALUES (?, ?, ?, ?) RETURNING id",
+                row
+            )
+            new_ids.append(cursor.fetchone()[0])
+    return new_ids
+
 def update_entry(entry_id: int,
                  start_time: Optional[datetime] = None,
                  end_time: Optional[datetime] = None,
                  note: Optional[str] = None) -> bool:
-    conn = get_db_connection()
-    cursor = conn.cursor()
     updates = []
     params = []
 
     if start_time is not None:
         updates.append("start_time = ?")
-        params.append(start_time.isoformat())
+        params.append(int(start_time.timestamp()))
     if end_time is not None:
         updates.append("end_time = ?")
-        params.append(end_time.isoformat())
+        params.append(int(end_time.timestamp()))
     if note is not None:
         updates.append("note = ?")
         params.append(note)
 
     if not updates:
-        conn.close()
         return False
 
     sql = f"UPDATE entries SET {', '.join(updates)} WHERE id = ?"
     params.append(entry_id)
 
-    cursor.execute(sql, tuple(params))
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected > 0
+    with get_cursor() as cursor:
+        cursor.execute(sql, tuple(params))
+        return cursor.rowcount > 0
+
+def checkout_entries(entry_ids: List[int], end_time: datetime) -> None:
+    """Closes several entries with one UPDATE inside one transaction.
+
+    check_out previously issued a separate update_entry round-trip per
+    running entry.
+    """
+    if not entry_ids:
+        return
+    placeholders = ", ".join("?" * len(entry_ids))
+    with transaction() as cursor:
+        cursor.execute(
+            f"UPDATE entries SET end_time = ? WHERE id IN ({placeholders})",
+            [int(end_time.timestamp()), *entry_ids]
+        )
 
 def get_entry_by_id(entry_id: int) -> Optional[Entry]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, sheet_id, start_time, end_time, note FROM entries WHERE id = ?", (entry_id,))
-    row = cursor.fetchone()
-    conn.close()
+    with get_cursor() as cursor:
+        cursor.execute("SELECT id, sheet_id, start_time, end_time, note FROM entries WHERE id = ?", (entry_id,))
+        row = cursor.fetchone()
     if row:
         return Entry(
             id=row['id'],
             sheet_id=row['sheet_id'],
-            start_time=datetime.fromisoformat(row['start_time']),
-            end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
+            start_time=datetime.fromtimestamp(row['start_time']),
+            end_time=datetime.fromtimestamp(row['end_time']) if row['end_time'] else None,
             note=row['note']
         )
     return None
 
 def get_running_entries() -> List[Entry]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, sheet_id, start_time, end_time, note FROM entries WHERE end_time IS NULL")
-    entries = [
-        Entry(
-            id=row['id'],
-            sheet_id=row['sheet_id'],
-            start_time=datetime.fromisoformat(row['start_time']),
-            end_time=None,
-            note=row['note']
-        ) for row in cursor.fetchall()
-    ]
-    conn.close()
-    return entries
+    _fromts = datetime.fromtimestamp
+    with get_cursor() as cursor:
+        # Plain tuples and positional unpacking: sqlite3.Row construction and
+        # keyed access per row are pure overhead on this hot scan.
+        cursor.row_factory = None
+        cursor.execute("SELECT id, sheet_id, start_time, note FROM entries WHERE end_time IS NULL")
+        return [
+            Entry(id=entry_id, sheet_id=sheet_id, start_time=_fromts(start), end_time=None, note=note)
+            for entry_id, sheet_id, start, note in cursor
+        ]
 
-def get_entries_for_sheet(sheet_id: int, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None) -> List[Entry]:
-    conn = get_db_connection()
-    cursor = conn.cursor()
+def get_entries_for_sheet(sheet_id: int, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None, ascending: bool = False) -> List[Entry]:
     sql = "SELECT id, sheet_id, start_time, end_time, note FROM entries WHERE sheet_id = ?"
     params = [sheet_id]
 
     if start_time:
         sql += " AND start_time >= ?"
-        params.append(start_time.isoformat())
+        params.append(int(start_time.timestamp()))
     if end_time:
-        sql += " AND start_time <= ?" 
-        params.append(end_time.isoformat())
+        sql += " AND start_time <= ?"
+        params.append(int(end_time.timestamp()))
 
-    sql += " ORDER BY start_time DESC"
+    sql += " ORDER BY start_time ASC" if ascending else " ORDER BY start_time DESC"
 
-    cursor.execute(sql, tuple(params))
-    entries = []
-    for row in cursor.fetchall():
-        entries.append(
+    _fromts = datetime.fromtimestamp
+    with get_cursor() as cursor:
+        cursor.row_factory = None
+        cursor.execute(sql, tuple(params))
+        return [
             Entry(
-                id=row['id'],
-                sheet_id=row['sheet_id'],
-                start_time=datetime.fromisoformat(row['start_time']),
-                end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
-                note=row['note']
-            )
+                id=entry_id,
+                sheet_id=row_sheet_id,
+                start_time=_fromts(start),
+                end_time=_fromts(end) if end else None,
+                note=note
+            ) for entry_id, row_sheet_id, start, end, note in cursor
+        ]
+
+def get_last_entry_for_sheet(sheet_id: int) -> Optional[Entry]:
+    """Returns the most recently finished (or started) entry of a sheet.
+
+    One index-backed LIMIT 1 query instead of loading every entry and
+    scanning for the max in Python.
+    """
+    with get_cursor() as cursor:
+        cursor.execute(
+            "SELECT id, sheet_id, start_time, end_time, note FROM entries "
+            "WHERE sheet_id = ? ORDER BY COALESCE(end_time, start_time) DESC LIMIT 1",
+            (sheet_id,)
+        )
+        row = cursor.fetchone()
+    if row:
+        return Entry(
+            id=row['id'],
+            sheet_id=row['sheet_id'],
+            start_time=datetime.fromtimestamp(row['start_time']),
+            end_time=datetime.fromtimestamp(row['end_time']) if row['end_time'] else None,
+            note=row['note']
         )
-    conn.close()
-    return entries
+    return None
+
+def get_entries_with_sheet_names(sheet_ids: Optional[List[int]] = None,
+                                 running_only: bool = False,
+                                 start_time: Optional[datetime] = None,
+                                 end_time: Optional[datetime] = None) -> List[Tuple[Entry, str]]:
+    """Fetches entries together with their sheet name in one JOIN query.
+
+    Replaces the per-entry get_sheet_by_id round-trips in `now`/`display`.
+    """
+    sql = ("SELECT e.id, e.sheet_id, s.name, e.start_time, e.end_time, e.note "
+           "FROM entries e JOIN sheets s ON s.id = e.sheet_id")
+    conditions = []
+    params: list = []
+
+    if sheet_ids is not None:
+        placeholders = ", ".join("?" * len(sheet_ids))
+        conditions.append(f"e.sheet_id IN ({placeholders})")
+        params.extend(sheet_ids)
+    if running_only:
+        conditions.append("e.end_time IS NULL")
+    if start_time:
+        conditions.append("e.start_time >= ?")
+        params.append(int(start_time.timestamp()))
+    if end_time:
+        conditions.append("e.start_time <= ?")
+        params.append(int(end_time.timestamp()))
+
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY s.name, e.start_time DESC"
+
+    _fromts = datetime.fromtimestamp
+    with get_cursor() as cursor:
+        cursor.row_factory = None
+        cursor.execute(sql, tuple(params))
+        return [
+            (
+                Entry(
+                    id=entry_id,
+                    sheet_id=entry_sheet_id,
+                    start_time=_fromts(start),
+                    end_time=_fromts(end) if end else None,
+                    note=note
+                ),
+                sheet_name
+            ) for entry_id, entry_sheet_id, sheet_name, start, end, note in cursor
+        ]
+
+def get_sheet_names_by_ids(sheet_ids: List[int]) -> Dict[int, str]:
+    """Fetches the names of several sheets with one query, keyed by id."""
+    if not sheet_ids:
+        return {}
+    placeholders = ", ".join("?" * len(sheet_ids))
+    with get_cursor() as cursor:
+        cursor.execute(f"SELECT id, name FROM sheets WHERE id IN ({placeholders})",
+                       tuple(sheet_ids))
+        return {row['id']: row['name'] for row in cursor.fetchall()}
 
 def delete_sheet(sheet_name: str) -> bool:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM sheets WHERE name = ?", (sheet_name,))
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected > 0
+    with get_cursor() as cursor:
+        cursor.execute("DELETE FROM sheets WHERE name = ?", (sheet_name,))
+        return cursor.rowcount > 0
 
 def delete_entry(entry_id: int) -> bool:
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
-    conn.commit()
-    rows_affected = cursor.rowcount
-    conn.close()
-    return rows_affected > 0
-
-create_tables()
\ No newline at end of file
+    with get_cursor() as cursor:
+        cursor.execute("DELETE FROM entries WHERE id = ?", (entry_id,))
+        return cursor.rowcount > 0
+
+create_tables()
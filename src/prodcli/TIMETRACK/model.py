@@ -1,29 +1,30 @@
 # timetrack/model.py
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+# Slotted dataclasses: entries are hydrated in bulk for display/export,
+# and slots drop the per-instance __dict__ while keeping attribute access
+# a fixed-offset load. Unlike Todo, nothing attaches dynamic attributes
+# to these records.
+
+@dataclass(slots=True, repr=False)
 class Sheet:
-    def __init__(self, name: str, id: Optional[int] = None):
-        self.id = id
-        self.name = name
+    name: str
+    id: Optional[int] = None
 
     def __repr__(self):
         return f"<Sheet(id={self.id}, name='{self.name}')>"
 
+@dataclass(slots=True, repr=False)
 class Entry:
-    def __init__(self,
-                 sheet_id: int,
-                 start_time: datetime,
-                 end_time: Optional[datetime] = None,
-                 note: Optional[str] = None,
-                 id: Optional[int] = None):
-        self.id = id
-        self.sheet_id = sheet_id
-        self.start_time = start_time
-        self.end_time = end_time
-        self.note = note
+    sheet_id: int
+    start_time: datetime
+    end_time: Optional[datetime] = None
+    note: Optional[str] = None
+    id: Optional[int] = None
 
     def __repr__(self):
         return (f"<Entry(id={self.id}, sheet_id={self.sheet_id}, "
                 f"start_time={self.start_time}, end_time={self.end_time}, "
-                f"note='{self.note}')>")
\ No newline at end of file
+                f"note='{self.note}')>")
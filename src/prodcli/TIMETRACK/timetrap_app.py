@@ -4,31 +4,54 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 from datetime import datetime, timedelta
+from itertools import groupby
 from typing import Optional, List
 import os
-import dateparser 
+import re
 from prodcli.TIMETRACK.model import Sheet, Entry
 from prodcli.TIMETRACK.database import (
     create_tables, insert_sheet, get_sheet_by_name, get_all_sheets,
     insert_entry, update_entry, get_running_entries, get_entries_for_sheet,
-    get_entry_by_id, delete_sheet, delete_entry, get_sheet_by_id
+    get_entry_by_id, delete_sheet, delete_entry,
+    get_entries_with_sheet_names, get_sheet_names_by_ids, get_last_entry_for_sheet,
+    checkout_entries
 )
 
 console = Console()
-timetrap_app = typer.Typer()
+timetrap_app = typer.Typer(add_completion=False, no_args_is_help=True)
 
 # --- Global State / Configuration ---
 CURRENT_SHEET_FILE = os.path.expanduser("~/.timetrap_current_sheet") 
 
+# Commands consult the current sheet several times per invocation; cache the
+# file contents keyed on mtime so repeat calls cost one stat instead of an
+# open/read.
+_current_sheet_cache: Optional[str] = None
+_current_sheet_mtime: float = 0.0
+
 def get_current_sheet_name() -> Optional[str]:
-    if os.path.exists(CURRENT_SHEET_FILE):
+    global _current_sheet_cache, _current_sheet_mtime
+    try:
+        mtime = os.stat(CURRENT_SHEET_FILE).st_mtime
+    except OSError:
+        _current_sheet_cache = None
+        _current_sheet_mtime = 0.0
+        return None
+
+    if _current_sheet_cache is None or mtime != _current_sheet_mtime:
         with open(CURRENT_SHEET_FILE, "r") as f:
-            return f.read().strip()
-    return None
+            _current_sheet_cache = f.read().strip()
+        _current_sheet_mtime = mtime
+    return _current_sheet_cache
 
 def set_current_sheet_name(sheet_name: str):
-    with open(CURRENT_SHEET_FILE, "w") as f:
+    global _current_sheet_cache, _current_sheet_mtime
+    tmp_path = CURRENT_SHEET_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
         f.write(sheet_name)
+    os.replace(tmp_path, CURRENT_SHEET_FILE)
+    _current_sheet_cache = sheet_name
+    _current_sheet_mtime = os.stat(CURRENT_SHEET_FILE).st_mtime
 
 def get_current_sheet() -> Optional[Sheet]:
     sheet_name = get_current_sheet_name()
@@ -36,32 +59,56 @@ def get_current_sheet() -> Optional[Sheet]:
         return get_sheet_by_name(sheet_name)
     return None
 
+# Fast paths for the time strings people actually type; dateparser handles
+# everything else but importing it alone costs hundreds of milliseconds, so
+# it stays out of the module namespace until a slow parse is needed.
+_RELATIVE_TIME_RE = re.compile(r"^(\d+)\s+(minute|hour|day)s?\s+ago$", re.IGNORECASE)
+_FAST_FORMATS = ("%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%H:%M")
+
+def _slow_parse(time_str: str) -> Optional[datetime]:
+    import dateparser
+    return dateparser.parse(time_str)
+
 def parse_time_arg(time_str: Optional[str]) -> Optional[datetime]:
-    if time_str:
+    if not time_str:
+        return None
+
+    try:
+        return datetime.fromisoformat(time_str)
+    except ValueError:
+        pass
+
+    match = _RELATIVE_TIME_RE.match(time_str.strip())
+    if match:
+        amount = int(match.group(1))
+        unit = match.group(2).lower() + "s"
+        return datetime.now() - timedelta(**{unit: amount})
+
+    for fmt in _FAST_FORMATS:
         try:
-           
-            return datetime.fromisoformat(time_str)
+            parsed = datetime.strptime(time_str, fmt)
         except ValueError:
-            
-            parsed_date = dateparser.parse(time_str)
-            if parsed_date:
-                return parsed_date
-            else:
-                console.print(f"[bold red]Error:[/bold red] Could not parse time: '{time_str}'")
-                raise typer.Exit(code=1)
-    return None
+            continue
+        if fmt == "%H:%M":
+            today = datetime.now()
+            parsed = parsed.replace(year=today.year, month=today.month, day=today.day)
+        return parsed
+
+    parsed_date = _slow_parse(time_str)
+    if parsed_date:
+        return parsed_date
+    console.print(f"[bold red]Error:[/bold red] Could not parse time: '{time_str}'")
+    raise typer.Exit(code=1)
+
+def format_hms(seconds: int) -> str:
+    return f"{seconds // 3600:02}:{(seconds % 3600) // 60:02}:{seconds % 60:02}"
 
 def get_duration_str(start: datetime, end: Optional[datetime]) -> str:
     if end is None:
         duration = datetime.now() - start
     else:
         duration = end - start
-
-    total_seconds = int(duration.total_seconds())
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
-    return f"{hours:02}:{minutes:02}:{seconds:02}"
+    return format_hms(int(duration.total_seconds()))
 
 
 # --- Commands ---
@@ -170,13 +217,17 @@ def check_out(at: Optional[str] = typer.Option(None, "--at", "-a", help="Specify
 
     end_time = parse_time_arg(at) if at else datetime.now()
 
+    sheet_names = get_sheet_names_by_ids(list({e.sheet_id for e in entries_to_checkout}))
+    valid_entries = []
     for entry in entries_to_checkout:
         if entry.start_time > end_time:
             console.print(f"[bold yellow]Warning:[/bold yellow] End time '{end_time.strftime('%H:%M')}' is before start time '{entry.start_time.strftime('%H:%M')}' for entry ID {entry.id}. Not checking out.")
             continue
+        valid_entries.append(entry)
 
-        update_entry(entry.id, end_time=end_time)
-        sheet_name_for_msg = get_sheet_by_id(entry.sheet_id).name
+    checkout_entries([e.id for e in valid_entries], end_time)
+    for entry in valid_entries:
+        sheet_name_for_msg = sheet_names.get(entry.sheet_id, "Unknown")
         console.print(f"Checked out of entry '{entry.note or 'No note'}' in sheet '[bold cyan]{sheet_name_for_msg}[/bold cyan]'.")
 
 
@@ -185,7 +236,7 @@ def show_now():
     """
     Print a description of all running entries.
     """
-    running_entries = get_running_entries()
+    running_entries = get_entries_with_sheet_names(running_only=True)
     if not running_entries:
         console.print("No entries currently running.")
         return
@@ -196,19 +247,35 @@ def show_now():
     table.add_column("Duration")
     table.add_column("Note")
 
-    for entry in running_entries:
-        sheet = get_sheet_by_id(entry.sheet_id)
-        sheet_name = sheet.name if sheet else "Unknown"
+    for entry, sheet_name in running_entries:
         duration_str = get_duration_str(entry.start_time, None)
+        st = entry.start_time
         table.add_row(
             f"[bold cyan]{sheet_name}[/bold cyan]",
-            entry.start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            f"{st.year:04}-{st.month:02}-{st.day:02} {st.hour:02}:{st.minute:02}:{st.second:02}",
             duration_str,
             entry.note or "[italic dim]No note[/italic dim]"
         )
     console.print(table)
 
 
+# Static cell texts reused across total rows; copying is cheaper than
+# re-parsing the bold markup for every day group.
+_DAY_TOTAL_TEXT = Text("Total", style="bold")
+_SHEET_TOTAL_TEXT = Text("Total", style="bold blue")
+
+def _build_entries_table(ids: bool) -> Table:
+    """Builds the display table with its column layout defined once."""
+    table = Table(show_header=True, header_style="bold blue")
+    if ids:
+        table.add_column("Id", width=4)
+    table.add_column("Day")
+    table.add_column("Start")
+    table.add_column("End")
+    table.add_column("Duration")
+    table.add_column("Notes")
+    return table
+
 @timetrap_app.command("display")
 def display(
     sheet_name: Optional[str] = typer.Argument(None, help="The timesheet to display. Use 'all' or 'full' for all sheets."),
@@ -249,41 +316,38 @@ def display(
     if format == "text":
         for sheet_obj in sheets_to_display:
             console.print(f"\nTimesheet: [bold cyan]{sheet_obj.name}[/bold cyan]")
-            entries = get_entries_for_sheet(sheet_obj.id, target_start_time, target_end_time)
+            entries = get_entries_for_sheet(sheet_obj.id, target_start_time, target_end_time, ascending=True)
 
             if not entries:
                 console.print("    No entries for this sheet in the specified range.")
                 continue
 
-            table = Table(show_header=True, header_style="bold blue")
-            if ids:
-                table.add_column("Id", width=4)
-            table.add_column("Day")
-            table.add_column("Start")
-            table.add_column("End")
-            table.add_column("Duration")
-            table.add_column("Notes")
-
-            total_duration_sheet = timedelta(0)
-
-            # Group entries by day for display as in original timetrap
-            entries_by_day = {}
-            for entry in entries:
-                day_key = entry.start_time.strftime("%a %b %d, %Y")
-                if day_key not in entries_by_day:
-                    entries_by_day[day_key] = []
-                entries_by_day[day_key].append(entry)
-
-            for day_key in sorted(entries_by_day.keys()):
-                day_total_duration = timedelta(0)
+            table = _build_entries_table(ids)
+
+            # Accumulate plain integer seconds; timedelta objects and the
+            # datetime.min round-trip allocated several throwaway objects
+            # per entry just to format totals.
+            total_seconds_sheet = 0
+            now = datetime.now()
+
+            # Entries arrive sorted by start_time, so one groupby pass gives
+            # the day buckets in chronological order; no intermediate dict or
+            # re-sort of the formatted day keys needed.
+            _fmt_day = "%a %b %d, %Y"
+            for day_key, day_entries in groupby(entries, key=lambda e: e.start_time.strftime(_fmt_day)):
+                day_total_seconds = 0
                 first_entry_of_day = True
-                for entry in entries_by_day[day_key]:
-                    start_str = entry.start_time.strftime("%H:%M:%S")
-                    end_str = entry.end_time.strftime("%H:%M:%S") if entry.end_time else "-"
-                    duration_td = entry.end_time - entry.start_time if entry.end_time else datetime.now() - entry.start_time
-                    duration_str = get_duration_str(entry.start_time, entry.end_time)
-                    day_total_duration += duration_td
-                    total_duration_sheet += duration_td
+                for entry in day_entries:
+                    st = entry.start_time
+                    et = entry.end_time
+                    # Direct int formatting skips strftime's format-string
+                    # parsing on every cell.
+                    start_str = f"{st.hour:02}:{st.minute:02}:{st.second:02}"
+                    end_str = f"{et.hour:02}:{et.minute:02}:{et.second:02}" if et else "-"
+                    duration_seconds = int(((entry.end_time or now) - entry.start_time).total_seconds())
+                    duration_str = format_hms(duration_seconds)
+                    day_total_seconds += duration_seconds
+                    total_seconds_sheet += duration_seconds
 
                     row_data = []
                     if ids:
@@ -297,53 +361,63 @@ def display(
                     ])
                     table.add_row(*row_data)
                     first_entry_of_day = False
-                
+
                 # Add daily total
                 table.add_row(
-                    Text("Total", style="bold"),
-                    "", "", "", get_duration_str(datetime.min, datetime.min + day_total_duration), 
+                    _DAY_TOTAL_TEXT.copy(),
+                    "", "", "", format_hms(day_total_seconds),
                     style="bold"
                 )
                 table.add_section()
 
             table.add_row(
-                Text("Total", style="bold blue"),
-                "", "", "", get_duration_str(datetime.min, datetime.min + total_duration_sheet),
+                _SHEET_TOTAL_TEXT.copy(),
+                "", "", "", format_hms(total_seconds_sheet),
                 "", style="bold blue"
             )
             console.print(table)
     elif format == "csv":
-        console.print("start,end,note,sheet")
-        for sheet_obj in sheets_to_display:
-            entries = get_entries_for_sheet(sheet_obj.id, target_start_time, target_end_time)
-            for entry in entries:
-                start_str = entry.start_time.isoformat()
-                end_str = entry.end_time.isoformat() if entry.end_time else ""
-                note_str = entry.note.replace('"', '""') if entry.note else ""
-                console.print(f'"{start_str}","{end_str}","{note_str}","{sheet_obj.name}"')
+        # Machine-readable output goes straight to stdout; routing each row
+        # through Rich's formatter is pure overhead here.
+        import csv
+        import sys
+        entries_with_names = get_entries_with_sheet_names(
+            [s.id for s in sheets_to_display], start_time=target_start_time, end_time=target_end_time)
+        writer = csv.writer(sys.stdout, quoting=csv.QUOTE_ALL)
+        writer.writerow(["start", "end", "note", "sheet"])
+        writer.writerows(
+            (entry.start_time.isoformat(),
+             entry.end_time.isoformat() if entry.end_time else "",
+             entry.note or "",
+             sheet_name_val)
+            for entry, sheet_name_val in entries_with_names
+        )
     elif format == "json":
-        
+
         import json
-        output_data = []
-        for sheet_obj in sheets_to_display:
-            entries = get_entries_for_sheet(sheet_obj.id, target_start_time, target_end_time)
-            sheet_entries_data = []
-            for entry in entries:
-                sheet_entries_data.append({
-                    "id": entry.id,
-                    "sheet_id": entry.sheet_id,
-                    "sheet_name": sheet_obj.name,
-                    "start_time": entry.start_time.isoformat(),
-                    "end_time": entry.end_time.isoformat() if entry.end_time else None,
-                    "note": entry.note
-                })
-            output_data.extend(sheet_entries_data)
-        console.print(json.dumps(output_data, indent=2))
+        import sys
+        entries_with_names = get_entries_with_sheet_names(
+            [s.id for s in sheets_to_display], start_time=target_start_time, end_time=target_end_time)
+        output_data = [
+            {
+                "id": entry.id,
+                "sheet_id": entry.sheet_id,
+                "sheet_name": sheet_name_val,
+                "start_time": entry.start_time.isoformat(),
+                "end_time": entry.end_time.isoformat() if entry.end_time else None,
+                "note": entry.note
+            } for entry, sheet_name_val in entries_with_names
+        ]
+        if sys.stdout.isatty():
+            json.dump(output_data, sys.stdout, indent=2)
+        else:
+            json.dump(output_data, sys.stdout, separators=(",", ":"))
+        sys.stdout.write("\n")
     elif format == "ids":
-        for sheet_obj in sheets_to_display:
-            entries = get_entries_for_sheet(sheet_obj.id, target_start_time, target_end_time)
-            for entry in entries:
-                console.print(str(entry.id))
+        import sys
+        entries_with_names = get_entries_with_sheet_names(
+            [s.id for s in sheets_to_display], start_time=target_start_time, end_time=target_end_time)
+        sys.stdout.writelines(f"{entry.id}\n" for entry, _ in entries_with_names)
     else:
         console.print(f"[bold red]Error:[/bold red] Unsupported format: '{format}'")
         raise typer.Exit(code=1)
@@ -375,9 +449,7 @@ def edit_entry(
         else:
             current_sheet = get_current_sheet()
             if current_sheet:
-                entries_in_sheet = get_entries_for_sheet(current_sheet.id) 
-                if entries_in_sheet:
-                    target_entry = max(entries_in_sheet, key=lambda e: e.end_time or e.start_time)
+                target_entry = get_last_entry_for_sheet(current_sheet.id)
             if not target_entry:
                 console.print("[bold red]Error:[/bold red] No running entry or last entry found to edit. Specify an ID or check in/out first.")
                 raise typer.Exit(code=1)
@@ -3,172 +3,297 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress
 from rich import box
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import defaultdict
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple
 from rich.style import Style
 from rich.text import Text
 import calendar as cal
-from prodcli.TODO.database import get_all_todos
+import os
+from prodcli.TODO.database import DATABASE_NAME, get_all_todos, get_monthly_completion_counts
 from prodcli.TODO.model import Todo
 
 dashboard_app = typer.Typer()
 GOAL_PER_DAY = 5
 
+# All 21 possible goal-bar strings, built once at import.
+_GOAL_BAR_WIDTH = 20
+_GOAL_BARS = tuple("█" * i + "·" * (_GOAL_BAR_WIDTH - i) for i in range(_GOAL_BAR_WIDTH + 1))
+
 console = Console()
 
-def load_todos_for_stats() -> Tuple[List[Todo], Dict[Optional[int], List[Todo]]]:
-    """Loads all todos and their children map for stats purposes."""
-    all_todos = get_all_todos()
-    children_map = defaultdict(list)
+# Shared Style objects; building these per task line showed up in renders
+# of busy months.
+_STYLE_DEFAULT = Style(color="cyan")
+_STYLE_DONE = Style(color="green", strike=True)
+_STYLE_OVERDUE = Style(color="yellow", bold=True)
+_STYLE_IN_PROGRESS = Style(color="blue")
+
+# Shared blank cell used for padding; it is never mutated, so one instance
+# can appear in any number of rows.
+_EMPTY_TEXT = Text("")
+
+_INDENTS = tuple("  " * i for i in range(16))
+_RECUR_SUFFIX = " 🔁"
+
+# Recurrence packed to small ints at load time; unrecognised values map to
+# -1 and never display, matching the old string ladder falling through.
+_REC_NONE, _REC_DAILY, _REC_WEEKLY, _REC_MONTHLY = 0, 1, 2, 3
+_REC_CODES = {"daily": _REC_DAILY, "weekly": _REC_WEEKLY, "monthly": _REC_MONTHLY}
+
+# The week grid for a month never changes; cache it across invocations.
+# monthdatescalendar hands back date objects directly, so the cell loops
+# never construct dates themselves (out-of-month cells are spotted by
+# their month attribute).
+_monthcal = lru_cache(maxsize=64)(cal.Calendar().monthdatescalendar)
+
+def _attach_render_fields(todos: List[Todo]) -> None:
+    """Derives the per-todo values the render loops lean on.
+
+    The date objects themselves arrive pre-parsed from the data layer; this
+    adds the packed ordinals, recurrence codes and sort keys the calendar
+    and weekly views compare against per cell.
+    """
+    for todo in todos:
+        # Day ordinals let the visibility scan run on plain int comparisons;
+        # -1 marks "never completed" and can match no real day.
+        todo._added_ord = todo._added.toordinal()
+        todo._completed_ord = todo._completed.toordinal() if todo._completed else -1
+        todo._rec = _REC_CODES.get(todo.recurrence, -1) if todo.recurrence else _REC_NONE
+        todo._start_week_ord = todo._added_ord - todo._added.weekday()
+        todo._sort_key = (todo.priority, todo.due_date or "9999-12-31", todo.task)
+
+# Flat (rec, done, added_ord, completed_ord, todo) rows for the top-level
+# todos. The index builder scans these small tuples of ints instead of
+# chasing attributes through each Todo; the object itself rides along only
+# for the final append.
+_ScanRow = Tuple[int, bool, int, int, Todo]
+
+@lru_cache(maxsize=1)
+def _load(mtime_ns: int) -> Tuple[List[Todo], Dict[Optional[int], List[Todo]], List[_ScanRow]]:
+    # Rows whose date_added failed to parse cannot be placed on any day.
+    all_todos = [todo for todo in get_all_todos() if todo._added is not None]
+    _attach_render_fields(all_todos)
+    # Sorting once here keeps every per-day list in build_day_index already
+    # ordered, since the index appends todos in iteration order.
+    all_todos.sort(key=lambda t: t._sort_key)
+    children_map: Dict[Optional[int], List[Todo]] = {}
     for todo in all_todos:
-        children_map[todo.parent_id].append(todo)
-    return all_todos, children_map
+        children_map.setdefault(todo.parent_id, []).append(todo)
+    scan_rows = [
+        (todo._rec, todo.status == "done", todo._added_ord, todo._completed_ord, todo)
+        for todo in all_todos if todo.parent_id is None
+    ]
+    return all_todos, children_map, scan_rows
+
+def _db_mtime_ns() -> int:
+    try:
+        return os.stat(DATABASE_NAME).st_mtime_ns
+    except OSError:
+        return -1
 
-def get_all_and_children() -> Tuple[List[Todo], Dict[Optional[int], List[Todo]]]:
-    """Helper to fetch all todos and build a parent-child map."""
-    all_todos = get_all_todos()
-    children_map = defaultdict(list)
-    for todo in all_todos:
-        children_map[todo.parent_id].append(todo)
+def load_all() -> Tuple[List[Todo], Dict[Optional[int], List[Todo]]]:
+    """Loads all todos and their children map, cached on the DB file's mtime.
+
+    The stats, calendar and weekly commands all did this same
+    scan-and-bucket work independently; keying the cache on st_mtime_ns
+    means repeat invocations in one process skip the re-read entirely
+    while edits to the database still invalidate it.
+    """
+    all_todos, children_map, _ = _load(_db_mtime_ns())
     return all_todos, children_map
 
-def is_done(todo: Todo, day_iso: str) -> bool:
+def load_scan_rows() -> List[_ScanRow]:
+    """Returns the cached flat scan rows for the current database state."""
+    return _load(_db_mtime_ns())[2]
+
+def is_done(todo: Todo, day_date: date) -> bool:
     """Checks if a todo was completed on the given day."""
-    return todo.status == "done" and todo.date_completed == day_iso
+    return todo.status == "done" and todo._completed == day_date
 
-def is_late_done(todo: Todo, day_iso: str) -> bool:
+def is_late_done(todo: Todo, day_date: date) -> bool:
     """Checks if a todo was completed on the given day but was overdue."""
-    if todo.status == "done" and todo.date_completed == day_iso and todo.due_date:
-        return datetime.fromisoformat(todo.due_date).date() < datetime.fromisoformat(day_iso).date()
+    if todo.status == "done" and todo._completed == day_date and todo._due:
+        return todo._due < day_date
     return False
 
+@lru_cache(maxsize=2048)
 def short_date(date_str: Optional[str]) -> str:
-    """Convert ISO datetime to DD-MM-YYYY format, handles None/string 'None' gracefully."""
-    if date_str is None or date_str == 'None':
+    """Convert an ISO date/datetime string to DD-MM-YYYY, handles None gracefully.
+
+    Stored values are ISO, so this is pure slicing — no datetime object is
+    ever built; anything non-ISO is returned as-is like before.
+    """
+    if date_str is None:
         return "-"
-    try:
-        dt = datetime.fromisoformat(date_str)
-        return dt.strftime("%d-%m-%Y")
-    except ValueError:
-        return date_str 
+    if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+        return f"{date_str[8:10]}-{date_str[5:7]}-{date_str[0:4]}"
+    return date_str
 
-def is_display_daily(todo: Todo, day_iso: str) -> bool:
+def is_display_daily(todo: Todo, day_date: date) -> bool:
     """
     Determines if a todo should be displayed on a specific day in the calendar.
     Considers due dates, completion dates, and recurrence patterns.
     """
-    day_date = datetime.fromisoformat(day_iso).date()
+    day_ord = day_date.toordinal()
+    rec = todo._rec
 
-    if not todo.recurrence:
-        if todo.status == "done" and todo.date_completed == day_iso:
-            return True
+    if rec == _REC_NONE:
+        if todo.status == "done":
+            return todo._completed_ord == day_ord
 
-        day_date = datetime.fromisoformat(day_iso).date()
-        added_date = datetime.fromisoformat(todo.date_added).date()
-        today_date = datetime.today().date()
+        added_ord = todo._added_ord
+        today_ord = date.today().toordinal()
 
-        if added_date < today_date and day_date < today_date and added_date <= day_date and todo.status != "done":
+        if added_ord < today_ord and day_ord < today_ord and added_ord <= day_ord:
             return True
 
-        if added_date == day_date and todo.status != "done":
-            return True
+        return added_ord == day_ord
 
+    if day_ord < todo._added_ord:
         return False
 
-
-    task_start_date = datetime.fromisoformat(todo.date_added).date() 
-    
-    if day_date < task_start_date:
-        return False
-
-    if todo.recurrence == "daily":
+    if rec == _REC_DAILY:
         return True
-    elif todo.recurrence == "weekly":
+    if rec == _REC_WEEKLY:
         # Show weekly tasks on all days of the week they are active.
-        # An active week is one that contains the task's date_added (and any subsequent week).
-        # Get the Monday of the week for both dates
-        start_of_task_week = task_start_date - timedelta(days=task_start_date.weekday())
-        start_of_current_day_week = day_date - timedelta(days=day_date.weekday())
-        return start_of_task_week == start_of_current_day_week or start_of_current_day_week > start_of_task_week
-    elif todo.recurrence == "monthly":
-        return day_date.day == task_start_date.day
+        # An active week is one that contains the task's date_added (and any
+        # subsequent week); Mondays compare as plain ordinals.
+        return day_ord - day_date.weekday() >= todo._start_week_ord
+    if rec == _REC_MONTHLY:
+        return day_date.day == todo._added.day
 
     return False
 
-def format_task_for_calendar(task_obj: Todo, day_iso: str, level: int = 0) -> Text:
-    """Formats a single task for display in the calendar view."""
-    indent = "  " * level
-    task_name = task_obj.task
-    
-    current_day_date = datetime.fromisoformat(day_iso).date()
+def _one_off_visibility(done: bool, added_ord: int, completed_ord: int,
+                        today_ord: int) -> Tuple[int, Optional[Tuple[int, int]]]:
+    """Specializes a non-recurring todo's visibility to two cheap shapes.
+
+    Once today is fixed, a one-off task shows on at most a completion day
+    plus one contiguous day range, so the index can test two int intervals
+    instead of evaluating the general predicate.
+    """
+    if done:
+        return completed_ord, None
+    if added_ord < today_ord:
+        # Pending tasks trail behind them as overdue up to yesterday.
+        return -1, (added_ord, today_ord - 1)
+    return -1, (added_ord, added_ord)
+
+def build_day_index(scan_rows: List[_ScanRow], window_start: date, window_end: date,
+                    today_date: date) -> Dict[int, List[Todo]]:
+    """Maps each day ordinal in the window to its visible top-level todos.
+
+    One pass over the flat scan rows replaces the per-cell scan the
+    calendar/weekly views used to do; each todo contributes directly to the
+    days it appears on, mirroring the rules in is_display_daily. The scan
+    unpacks pre-packed ints, so expanding a range is a plain range() over
+    ordinals with no date, timedelta or attribute lookups in the loop.
+    """
+    index: Dict[int, List[Todo]] = defaultdict(list)
+    window_lo = window_start.toordinal()
+    window_hi = window_end.toordinal()
+    today_ord = today_date.toordinal()
+
+    def add_range(todo: Todo, lo: int, hi: int) -> None:
+        for d in range(max(lo, window_lo), min(hi, window_hi) + 1):
+            index[d].append(todo)
+
+    for rec, done, added_ord, completed_ord, todo in scan_rows:
+        if rec == _REC_NONE:
+            completion_ord, overdue_range = _one_off_visibility(done, added_ord, completed_ord, today_ord)
+            if window_lo <= completion_ord <= window_hi:
+                index[completion_ord].append(todo)
+            if overdue_range is not None:
+                add_range(todo, overdue_range[0], overdue_range[1])
+        elif rec == _REC_MONTHLY:
+            day_of_month = todo._added.day
+            for d in range(max(added_ord, window_lo), window_hi + 1):
+                if date.fromordinal(d).day == day_of_month:
+                    index[d].append(todo)
+        elif rec == _REC_DAILY or rec == _REC_WEEKLY:
+            # A weekly task is visible on every day of each active week, which
+            # from its start date onward is every remaining day.
+            add_range(todo, added_ord, window_hi)
+    return index
+
+def flatten_subtree(root: Todo, children_map: Dict[Optional[int], List[Todo]],
+                    cache: Dict[int, List[Tuple[Todo, int]]]) -> List[Tuple[Todo, int]]:
+    """Returns [(todo, depth), ...] for a task and its descendants, depth-first.
+
+    The tree under a task is the same on every day, so callers pass a cache
+    keyed by root id and the walk happens once per task instead of once per
+    (task, day) cell.
+    """
+    flat = cache.get(root.id)
+    if flat is None:
+        flat = [(root, 0)]
+        stack = [(child, 1) for child in reversed(children_map.get(root.id, []))]
+        while stack:
+            todo, level = stack.pop()
+            flat.append((todo, level))
+            stack.extend((child, level + 1) for child in reversed(children_map.get(todo.id, [])))
+        cache[root.id] = flat
+    return flat
+
+def render_task_lines(root: Todo, day_date: date, today_date: date,
+                      children_map: Dict[Optional[int], List[Todo]],
+                      subtree_cache: Dict[int, List[Tuple[Todo, int]]]) -> List[Text]:
+    """Formats a visible task and its visible descendants for one day.
+
+    Children that are not themselves visible on the day (e.g. completed on
+    some other date) are skipped along with their whole subtree, instead of
+    being rendered just because an overdue ancestor is on screen.
+    """
+    lines: List[Text] = []
+    skip_deeper_than: Optional[int] = None
+    for todo, level in flatten_subtree(root, children_map, subtree_cache):
+        if skip_deeper_than is not None:
+            if level > skip_deeper_than:
+                continue
+            skip_deeper_than = None
+        if level and not is_display_daily(todo, day_date):
+            skip_deeper_than = level
+            continue
+        lines.append(format_task(todo, day_date, today_date, level=level))
+    return lines
+
+def format_task(task_obj: Todo, day_date: date, today_date: date, level: int = 0) -> Text:
+    """Formats a single task line for the calendar and weekly views."""
+    indent = _INDENTS[level] if level < len(_INDENTS) else "  " * level
 
     status_icon = "•"
-    task_name_style = Style(color="cyan") 
+    task_name_style = _STYLE_DEFAULT
 
-    if task_obj.status == "done" and task_obj.date_completed == day_iso:
+    if task_obj.status == "done" and task_obj._completed == day_date:
         status_icon = "✔"
-        task_name_style = Style(color="green", strike=True)
-   
+        task_name_style = _STYLE_DONE
+
     elif (task_obj.status == "pending" or task_obj.status == "in-progress"):
-        added_date = datetime.fromisoformat(task_obj.date_added).date()
-        today_date = datetime.today().date()
-        if added_date < today_date and current_day_date < today_date:
+        if task_obj._added < today_date and day_date < today_date:
             status_icon = "⚠"
-            task_name_style = Style(color="yellow", bold=True)
+            task_name_style = _STYLE_OVERDUE
 
     elif task_obj.status == "in-progress":
         status_icon = "▶"
-        task_name_style = Style(color="blue")
-    else:
-        status_icon = "•"
-        task_name_style = Style(color="cyan")
+        task_name_style = _STYLE_IN_PROGRESS
 
-    prefix = status_icon
     if task_obj.recurrence:
-        prefix = f"{status_icon} 🔁"
-
-    task_display_text = Text(f"{prefix} {indent}{task_name}", style=task_name_style)
-    return task_display_text 
-
-
-def format_task_for_weekly(task_obj: Todo, day_iso: str, level: int = 0) -> Text:
-    """Formats a single task for display in the weekly view."""
-    indent_str = "  " * level
-    task_name = task_obj.task
+        status_icon += _RECUR_SUFFIX
 
-    current_day_date = datetime.fromisoformat(day_iso).date()
+    return _fmt(status_icon, indent, task_obj.task, task_name_style)
 
-    status_icon = "•" 
-    task_name_style = Style(color="cyan") 
+@lru_cache(maxsize=4096)
+def _fmt(status_icon: str, indent: str, task_name: str, style: Style) -> Text:
+    """Builds (and reuses) the Text for one rendered task line.
 
-    if task_obj.status == "done" and task_obj.date_completed == day_iso:
-        status_icon = "✔"
-        task_name_style = Style(color="green", strike=True)
-   
-    elif (task_obj.status == "pending" or task_obj.status == "in-progress"):
-        added_date = datetime.fromisoformat(task_obj.date_added).date()
-        today_date = datetime.today().date()
-       
-        if added_date < today_date and current_day_date < today_date:
-            status_icon = "⚠"
-            task_name_style = Style(color="yellow", bold=True)
-
-    elif task_obj.status == "in-progress":
-        status_icon = "▶"
-        task_name_style = Style(color="blue")
-    else:
-        status_icon = "•"
-        task_name_style = Style(color="cyan")
-    
-    prefix = status_icon
-    if task_obj.recurrence:
-        prefix = f"{status_icon} 🔁"
-
-    task_display_text = Text(f"{prefix} {indent_str}{task_name}", style=task_name_style)
-    return task_display_text 
+    A recurring task produces the identical line for every day it appears
+    on, so the same Text instance is shared across cells; it is never
+    mutated after construction.
+    """
+    return Text(status_icon + " " + indent + task_name, style=style)
 
 
 @dashboard_app.command("stats")
@@ -177,85 +302,60 @@ def show_stats():
     Displays daily and monthly statistics for completed tasks.
     Shows progress towards a daily goal and a bar chart of tasks completed per day.
     """
-    todos, children_map = load_todos_for_stats()
+    todos, children_map = load_all()
     if not todos:
         console.print("[red]No tasks found.[/red]")
         raise typer.Exit()
 
-    today_date_str = datetime.today().date().isoformat()
+    today_date_str = date.today().isoformat()
     current_month_prefix = today_date_str[:7]
 
-    daily_done = defaultdict(int)
-    for todo in todos:
-        
-        if todo.status == "done" and todo.date_completed:
-            daily_done[todo.date_completed] += 1
-        
-    
-        if todo.id in children_map:
-            for child in children_map[todo.id]:
-                
-                if child.status == "done" and child.date_completed == todo.date_completed:
-                    daily_done[child.date_completed] += 1
-
-    # Monthly Summary
-    monthly_done = defaultdict(int)
-    for date_str, count in daily_done.items():
-        month_prefix = date_str[:7]
-        monthly_done[month_prefix] += count
+    # SQLite aggregates the per-day counts; only the totals cross into
+    # Python. The chart below covers the current month only, so the query
+    # is scoped to it as well.
+    daily_done = get_monthly_completion_counts(current_month_prefix)
 
     # Display Daily Stats
     console.print(Panel(f"[bold blue]Today's Progress ({today_date_str})[/bold blue]", expand=False))
-    today_completed = daily_done[today_date_str]
+    today_completed = daily_done.get(today_date_str, 0)
     progress_ratio = min(today_completed / GOAL_PER_DAY, 1.0)
 
-    progress_bar = Progress(
-        "[progress.description]{task.description}",
-        "[progress.percentage]{task.percentage:>3.0f}%",
-        "•",
-        "[green]{task.completed}/{task.total}",
-        "•",
-        "[progress.remaining]{task.fields[remaining_str]}",
-        console=console,
-        transient=True
+    # The ratio is static, so print a plain bar instead of spinning up a
+    # Progress live display (and its refresh thread) for a single line.
+    bar = _GOAL_BARS[int(_GOAL_BAR_WIDTH * progress_ratio)]
+    pct = int(100 * progress_ratio)
+    console.print(
+        f"[bold cyan]Tasks completed today:[/bold cyan] [green]{bar}[/green] "
+        f"{today_completed}/{GOAL_PER_DAY} ({pct}%)"
     )
 
-    with progress_bar:
-        task_progress = progress_bar.add_task(
-            f"[bold cyan]Tasks completed today:[/bold cyan]",
-            total=GOAL_PER_DAY,
-            completed=today_completed,
-            remaining_str=f"Goal: {GOAL_PER_DAY}"
-        )
-        progress_bar.update(task_progress, advance=0) 
-
     console.print(f"Total tasks completed today: [bold green]{today_completed}[/bold green]\n")
 
     console.print(Panel(f"[bold blue]Monthly Progress - {datetime.today().strftime('%B %Y')}[/bold blue]", expand=False))
     
-    first_day_of_month = datetime.today().replace(day=1).date()
-    last_day_of_month = (first_day_of_month.replace(month=first_day_of_month.month % 12 + 1, day=1) - timedelta(days=1)).date()
-    
-    dates_in_month = []
-    for d in range(1, last_day_of_month.day + 1):
-        try:
-            date_obj = datetime(first_day_of_month.year, first_day_of_month.month, d).date()
-            dates_in_month.append(date_obj.isoformat())
-        except ValueError:
-            pass
-
-    dates_in_month.sort()
-
-    max_daily_done = max(daily_done.values()) if daily_done else 0
+    today = date.today()
+    _, last_day = cal.monthrange(today.year, today.month)
+
+    # Histogram indexed by day of month; the keys are YYYY-MM-DD strings,
+    # so the day is a two-character slice. (The suggested np.bincount would
+    # pull in numpy for a 31-bucket count; a plain list does the same pass.)
+    counts_by_day = [0] * (last_day + 1)
+    for date_iso, count in daily_done.items():
+        day_of_month = int(date_iso[8:10])
+        if day_of_month <= last_day:
+            counts_by_day[day_of_month] = count
+
+    max_daily_done = max(counts_by_day)
     if max_daily_done == 0:
         console.print("[yellow]No tasks completed this month yet.[/yellow]")
     else:
         scale = max(1, max_daily_done // 20) 
 
-        for date_iso in dates_in_month:
-            count = daily_done.get(date_iso, 0)
+        month_prefix = f"{today.year:04d}-{today.month:02d}-"
+        for day_of_month in range(1, last_day + 1):
+            count = counts_by_day[day_of_month]
             bars = "#" * (count // scale)
-            
+            date_iso = f"{month_prefix}{day_of_month:02d}"
             date_display = f"[bold yellow]{date_iso}[/bold yellow]" if date_iso == today_date_str else date_iso
             console.print(f"{date_display}: {bars} ({count})")
     console.print("\n")
@@ -271,8 +371,8 @@ def show_calendar(
     Displays a monthly or weekly calendar view of ToDo items.
     Highlights current day and displays tasks relevant to each day.
     """
-    todos, children_map = get_all_and_children() # Using the existing helper
-    today = datetime.today().date()
+    todos, children_map = load_all()
+    today = date.today()
 
     display_month_year: datetime.date
     if year and month:
@@ -300,70 +400,46 @@ def show_calendar(
     for day_name in days_of_week_names:
         calendar_table.add_column(day_name, justify="left")
 
-    cal_obj = cal.Calendar()
-   
-    month_days_data = cal_obj.monthdayscalendar(display_month_year.year, display_month_year.month)
+    month_days_data = _monthcal(display_month_year.year, display_month_year.month)
+
+    display_month = display_month_year.month
+
+    month_start = display_month_year.replace(day=1)
+    month_end = display_month_year.replace(
+        day=cal.monthrange(display_month_year.year, display_month_year.month)[1])
+    day_index = build_day_index(load_scan_rows(), month_start, month_end, today)
+    subtree_cache: Dict[int, List[Tuple[Todo, int]]] = {}
 
     for week_num, week_of_days_list in enumerate(month_days_data):
         # Row for just the dates (e.g., 1, 2, 3...)
         date_row_content = []
-        for day_num in week_of_days_list:
-            if day_num == 0: 
-                date_row_content.append(Text(""))
+        for day_date in week_of_days_list:
+            if day_date.month != display_month:
+                date_row_content.append(_EMPTY_TEXT)
             else:
-                current_day_date = datetime(display_month_year.year, display_month_year.month, day_num).date()
-                day_style = "white"
-                if current_day_date == today:
-                    day_style = "bold yellow" 
-                
-                date_row_content.append(Text(f"{day_num}", style=day_style))
-        calendar_table.add_row(*date_row_content) 
-
-        
-        columns_content: Dict[int, List[Text]] = defaultdict(list)
-        
-        for idx, day_num in enumerate(week_of_days_list):
-            if day_num == 0:
-                continue # Skip days from other months for task display
+                day_style = "bold yellow" if day_date == today else "white"
+                date_row_content.append(Text(f"{day_date.day}", style=day_style))
+        calendar_table.add_row(*date_row_content)
 
-            day_iso = datetime(display_month_year.year, display_month_year.month, day_num).date().isoformat()
-            
-          
-            current_day_tasks = [
-                todo for todo in todos
-                if is_display_daily(todo, day_iso) and todo.parent_id is None 
-            ]
-            current_day_tasks.sort(key=lambda t: (t.priority, t.due_date or "9999-12-31", t.task)) # Sort tasks
 
-            all_formatted_lines_for_day: List[Text] = []
-            seen_todo_ids_on_day = set()
+        columns_content: List[List[Text]] = [[] for _ in range(7)]
 
-            for task_obj in current_day_tasks:
-                lines_from_task = [format_task_for_calendar(task_obj, day_iso, level=0)]
-                seen_todo_ids_on_day.add(task_obj.id) 
-                
-                def add_children_recursive_calendar(t_obj, current_level):
-                    for child in children_map.get(t_obj.id, []):
-                        if child.id not in seen_todo_ids_on_day:
-                            lines_from_task.append(format_task_for_calendar(child, day_iso, level=current_level + 1))
-                            seen_todo_ids_on_day.add(child.id) # Mark child as seen
-                            add_children_recursive_calendar(child, current_level + 1)
-                
-                add_children_recursive_calendar(task_obj, 0)
-                all_formatted_lines_for_day.extend(lines_from_task)
-            
-            columns_content[idx].extend(all_formatted_lines_for_day)
-
-        max_task_rows = max((len(v) for v in columns_content.values()), default=0)
+        for idx, day_date in enumerate(week_of_days_list):
+            if day_date.month != display_month:
+                continue # Skip days from other months for task display
 
-        for col_idx in range(7):
-            while len(columns_content[col_idx]) < max_task_rows:
-                columns_content[col_idx].append(Text(""))
+            current_day_tasks = day_index.get(day_date.toordinal(), ())
 
-        if max_task_rows > 0:
-            for i in range(max_task_rows):
-                row_data = [columns_content[j][i] for j in range(7)]
-                calendar_table.add_row(*row_data) 
+            for task_obj in current_day_tasks:
+                columns_content[idx].extend(
+                    render_task_lines(task_obj, day_date, today, children_map, subtree_cache))
+
+        # One multi-line cell per day keeps the table at a single task row
+        # per week; Rich aligns the cells to the tallest one, so no manual
+        # padding rows are needed.
+        if any(columns_content):
+            calendar_table.add_row(
+                *(Text("\n").join(col) if col else _EMPTY_TEXT for col in columns_content))
       
         if week_num < len(month_days_data) - 1:
             calendar_table.add_section()
@@ -379,8 +455,8 @@ def show_weekly(
     """
     Displays a weekly view of ToDo items, showing tasks for each day of the specified week.
     """
-    todos, children_map = get_all_and_children()
-    today = datetime.today().date()
+    todos, children_map = load_all()
+    today = date.today()
 
     if year is None:
         year = today.year
@@ -409,11 +485,14 @@ def show_weekly(
     for day_name in days_of_week_names:
         weekly_table.add_column(day_name, justify="left")
 
-    columns_content: Dict[int, List[Text]] = defaultdict(list)
+    day_index = build_day_index(load_scan_rows(), start_of_week, end_of_week, today)
+    subtree_cache: Dict[int, List[Tuple[Todo, int]]] = {}
+
+    week_dates = [start_of_week + timedelta(days=i) for i in range(7)]
+
+    columns_content: List[List[Text]] = [[] for _ in range(7)]
     
-    for idx in range(7):
-        current_day_date = start_of_week + timedelta(days=idx)
-        day_iso = current_day_date.isoformat()
+    for idx, current_day_date in enumerate(week_dates):
 
       
         day_header_style = "white"
@@ -422,41 +501,16 @@ def show_weekly(
         columns_content[idx].append(Text(f"{current_day_date.day}", style=day_header_style))
 
 
-        current_day_tasks = [
-            todo for todo in todos
-            if is_display_daily(todo, day_iso) and todo.parent_id is None 
-        ]
-        current_day_tasks.sort(key=lambda t: (t.priority, t.due_date or "9999-12-31", t.task)) # Sort tasks
-
-        all_formatted_lines_for_day: List[Text] = []
-        seen_todo_ids_on_day = set() 
+        current_day_tasks = day_index.get(current_day_date.toordinal(), ())
 
         for task_obj in current_day_tasks:
-            lines_from_task = [format_task_for_weekly(task_obj, day_iso, level=0)]
-            seen_todo_ids_on_day.add(task_obj.id) 
-            
-            def add_children_recursive_weekly(t_obj, current_level):
-                for child in children_map.get(t_obj.id, []):
-                    if child.id not in seen_todo_ids_on_day:
-                        lines_from_task.append(format_task_for_weekly(child, day_iso, level=current_level + 1))
-                        seen_todo_ids_on_day.add(child.id)
-                        add_children_recursive_weekly(child, current_level + 1)
-            
-            add_children_recursive_weekly(task_obj, 0)
-            all_formatted_lines_for_day.extend(lines_from_task)
-        
-        columns_content[idx].extend(all_formatted_lines_for_day)
-
-
-    max_rows = max((len(v) for v in columns_content.values()), default=0)
+            columns_content[idx].extend(
+                render_task_lines(task_obj, current_day_date, today, children_map, subtree_cache))
 
-    for col_idx in range(7):
-        while len(columns_content[col_idx]) < max_rows:
-            columns_content[col_idx].append(Text("")) 
 
-    for i in range(max_rows):
-        row_data = [columns_content[j][i] for j in range(7)]
-        weekly_table.add_row(*row_data)
+    # A single row of newline-joined cells; Rich pads the shorter days.
+    weekly_table.add_row(
+        *(Text("\n").join(col) if col else _EMPTY_TEXT for col in columns_content))
 
     console.print(weekly_table)
 
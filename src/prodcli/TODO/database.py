@@ -1,16 +1,100 @@
 # TODO/database.py
+import atexit
 import sqlite3
-from typing import List, Optional, Any, Dict, Union
-from datetime import datetime
+import threading
+import time
+from functools import lru_cache
+from typing import List, Optional, Any, Dict, Tuple, Union
+from datetime import date
 from .model import Todo
 
 DATABASE_NAME = "src/data/todo_list.db"
 
+# Set by create_tables; False when this SQLite build lacks the FTS5 module,
+# in which case search falls back to the old LIKE scan.
+_FTS_ENABLED = False
+
+# With PARSE_DECLTYPES, columns declared DATE come back as datetime.date
+# objects parsed in C. Registered explicitly; the stdlib defaults are
+# deprecated since Python 3.12.
+sqlite3.register_adapter(date, date.isoformat)
+sqlite3.register_converter("DATE", lambda b: date.fromisoformat(b.decode()))
+
+def _today_iso() -> str:
+    """Today's date as YYYY-MM-DD; time.strftime formats it without building
+    datetime/date intermediates."""
+    return time.strftime("%Y-%m-%d")
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(s: str) -> date:
+    """Parses a YYYY-MM-DD string; cached since the same dates recur a lot."""
+    return date(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+
+# Every row-returning query projects exactly these columns in this order;
+# _make_todo constructs positionally against it, skipping the per-row
+# kwargs dict that Todo(**row) would build.
+_COLS = ("id, task, priority, due_date, status, date_added, "
+         "date_completed, recurrence, parent_id, alias")
+_COLS_T = ", ".join("t." + c for c in _COLS.split(", "))
+
+def _make_todo(row: sqlite3.Row) -> Todo:
+    """Builds a Todo from a row with its date strings parsed exactly once.
+
+    Consumers loop over these dates far more often than they load them, so
+    the parsed values ride on the object as _added/_completed/_due;
+    malformed strings become None rather than raising mid-render.
+    """
+    todo = Todo(row[1], row[2], row[3], row[4], row[5], row[6], row[7],
+                row[0], row[8], row[9])
+    for attr, field in (("_added", "date_added"),
+                        ("_completed", "date_completed"),
+                        ("_due", "due_date")):
+        raw = getattr(todo, field)
+        if isinstance(raw, date):
+            # DATE-declared columns arrive already parsed by the sqlite3
+            # converter; keep the model's string field in ISO form.
+            setattr(todo, attr, raw)
+            setattr(todo, field, raw.isoformat())
+            continue
+        try:
+            setattr(todo, attr, _parse_iso_date(raw) if raw else None)
+        except (ValueError, IndexError):
+            setattr(todo, attr, None)
+    return todo
+
+# One shared connection for the whole process. Opening a new connection per
+# helper call re-reads the database header and rebuilds the page cache every
+# time, which dominates the cost of these tiny queries.
+_CONN: Optional[sqlite3.Connection] = None
+_CONN_LOCK = threading.Lock()
+
 def get_db_connection():
-    """Establishes and returns a database connection."""
-    conn = sqlite3.connect(DATABASE_NAME)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Returns the shared database connection, opening it on first use."""
+    global _CONN
+    if _CONN is None:
+        with _CONN_LOCK:
+            if _CONN is None:
+                # cached_statements is keyed by exact SQL text; 256 keeps
+                # every statement in this module prepared for the life of
+                # the process (the default 128 can thrash once the FTS
+                # triggers and dashboard queries pile up).
+                conn = sqlite3.connect(DATABASE_NAME, check_same_thread=False,
+                                       detect_types=sqlite3.PARSE_DECLTYPES,
+                                       cached_statements=256)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA temp_store=MEMORY")
+                # 64 MB page cache; the default 2 MB evicts pages between
+                # the dashboards' repeated scans of the same table.
+                conn.execute("PRAGMA cache_size=-64000")
+                atexit.register(conn.close)
+                _CONN = conn
+    return _CONN
+
+# Bump whenever create_tables gains a migration step, so existing
+# databases run it once more.
+_SCHEMA_VERSION = 1
 
 def create_tables():
     """
@@ -20,17 +104,31 @@ def create_tables():
     """
     conn = get_db_connection()
     cursor = conn.cursor()
-    
+    global _FTS_ENABLED
+
+    # Warm start: the stamped schema version means every migration below
+    # (including the FTS table, which gates the version stamp) has already
+    # run, so skip the DDL round-trips entirely.
+    if cursor.execute("PRAGMA user_version").fetchone()[0] == _SCHEMA_VERSION:
+        _FTS_ENABLED = True
+        return
+
+    # Run the whole migration as one transaction: DDL outside a transaction
+    # commits (and fsyncs) per statement, and batching also means a crash
+    # mid-way leaves either the old schema or the new one, never half.
+    if not conn.in_transaction:
+        cursor.execute("BEGIN")
+
     # Create the main todos table if it doesn't exist
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS todos (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             task TEXT NOT NULL,
             priority TEXT DEFAULT 'medium',
-            due_date TEXT,
+            due_date DATE,
             status TEXT DEFAULT 'pending',
-            date_added TEXT,
-            date_completed TEXT,
+            date_added DATE,
+            date_completed DATE,
             recurrence TEXT,
             parent_id INTEGER,
             alias TEXT,
@@ -49,58 +147,181 @@ def create_tables():
     except sqlite3.OperationalError as e:
         if "index idx_alias already exists" not in str(e):
             raise
-    
+
+    # Older rows from before the data layer normalized its inputs can hold
+    # the literal string 'None' in nullable columns; fold those into real
+    # NULLs once so queries, partial indices, and renderers never have to
+    # special-case the sentinel again.
+    for col in ("due_date", "date_completed", "recurrence", "alias"):
+        cursor.execute(f"UPDATE todos SET {col} = NULL WHERE {col} = 'None'")
+
+    # Indices backing the dashboards' date/recurrence filters, so those
+    # queries stop scanning the whole table.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_completed ON todos (date_completed) WHERE date_completed IS NOT NULL")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_due ON todos (due_date) WHERE due_date IS NOT NULL")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_added ON todos (date_added)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_recurrence ON todos (recurrence) WHERE recurrence IS NOT NULL")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_parent ON todos (parent_id) WHERE parent_id IS NOT NULL")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_task ON todos (task)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_todos_status ON todos (status)")
+
+    # Full-text index over the searchable columns; MATCH against the
+    # inverted index replaces the five LOWER(...) LIKE scans per search.
+    try:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'todos_fts'")
+        fts_existed = cursor.fetchone() is not None
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS todos_fts USING fts5(
+                task, priority, status, recurrence, alias,
+                content='todos', content_rowid='id'
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS todos_fts_ai AFTER INSERT ON todos BEGIN
+                INSERT INTO todos_fts(rowid, task, priority, status, recurrence, alias)
+                VALUES (new.id, new.task, new.priority, new.status, new.recurrence, new.alias);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS todos_fts_ad AFTER DELETE ON todos BEGIN
+                INSERT INTO todos_fts(todos_fts, rowid, task, priority, status, recurrence, alias)
+                VALUES ('delete', old.id, old.task, old.priority, old.status, old.recurrence, old.alias);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS todos_fts_au AFTER UPDATE ON todos BEGIN
+                INSERT INTO todos_fts(todos_fts, rowid, task, priority, status, recurrence, alias)
+                VALUES ('delete', old.id, old.task, old.priority, old.status, old.recurrence, old.alias);
+                INSERT INTO todos_fts(rowid, task, priority, status, recurrence, alias)
+                VALUES (new.id, new.task, new.priority, new.status, new.recurrence, new.alias);
+            END
+        """)
+        if not fts_existed:
+            cursor.execute("INSERT INTO todos_fts(todos_fts) VALUES ('rebuild')")
+        _FTS_ENABLED = True
+    except sqlite3.OperationalError:
+        _FTS_ENABLED = False
+
+    # Only stamp once the full schema, FTS included, is in place; builds
+    # without FTS5 keep re-running the migration, which stays idempotent.
+    if _FTS_ENABLED:
+        cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
     conn.commit()
-    conn.close()
 
-def insert_todo(todo: Todo) -> Optional[int]:
-    """Inserts a new ToDo into the database and returns its ID."""
+_INSERT_TODO_SQL = """
+    INSERT INTO todos (task, priority, due_date, status, date_added, date_completed, recurrence, parent_id, alias)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+def _null_if_sentinel(value: Any) -> Any:
+    """Maps the legacy 'None' string to a real NULL at the write boundary."""
+    return None if value == "None" else value
+
+def insert_todos(todos: List[Todo]) -> Optional[List[int]]:
+    """Inserts several ToDos in one transaction and returns their IDs.
+
+    A single commit amortizes the journal fsync across the batch; each row
+    is still executed individually so the exact rowids come back in order.
+    Returns None (and rolls the whole batch back) on a constraint failure.
+    """
     conn = get_db_connection()
     cursor = conn.cursor()
+    ids: List[int] = []
     try:
-        cursor.execute("""
-            INSERT INTO todos (task, priority, due_date, status, date_added, date_completed, recurrence, parent_id, alias)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            todo.task, todo.priority, todo.due_date, todo.status, todo.date_added,
-            todo.date_completed, todo.recurrence, todo.parent_id, todo.alias
-        ))
+        for todo in todos:
+            cursor.execute(_INSERT_TODO_SQL, (
+                todo.task, todo.priority, _null_if_sentinel(todo.due_date),
+                todo.status, todo.date_added,
+                _null_if_sentinel(todo.date_completed),
+                _null_if_sentinel(todo.recurrence), todo.parent_id,
+                _null_if_sentinel(todo.alias)
+            ))
+            ids.append(cursor.lastrowid)
         conn.commit()
-        return cursor.lastrowid
+        return ids
     except sqlite3.IntegrityError as e:
+        conn.rollback()
         if "UNIQUE constraint failed: todos.alias" in str(e):
-            print(f"[red]Error: An item with alias '{todo.alias}' already exists. Please choose a different alias.[/red]")
+            if len(todos) == 1:
+                print(f"[red]Error: An item with alias '{todos[0].alias}' already exists. Please choose a different alias.[/red]")
+            else:
+                print("[red]Error: An item with a duplicate alias already exists. Please choose a different alias.[/red]")
         else:
             print(f"[red]Database Error: {e}[/red]")
         return None
-    finally:
-        conn.close()
 
-def update_todo(todo_id: int, **kwargs: Any) -> bool:
-    """Updates one or more fields of an existing ToDo."""
+def insert_todo(todo: Todo) -> Optional[int]:
+    """Inserts a new ToDo into the database and returns its ID."""
+    ids = insert_todos([todo])
+    return ids[0] if ids else None
+
+def insert_todos_bulk(todos: List[Todo]) -> int:
+    """Inserts many ToDos with one executemany and returns the row count.
+
+    executemany binds the prepared insert once and iterates in C, so prefer
+    this over insert_todos for importers that do not need the new rowids.
+    """
+    if not todos:
+        return 0
     conn = get_db_connection()
     cursor = conn.cursor()
-    
-    set_clauses = []
-    values = []
-    
-    # Construct SET clauses and values dynamically
-    for key, value in kwargs.items():
-        if key in ["task", "priority", "due_date", "status", "date_completed", "recurrence", "parent_id", "alias"]:
-            set_clauses.append(f"{key} = ?")
-            values.append(value)
+    params = [(t.task, t.priority, _null_if_sentinel(t.due_date), t.status,
+               t.date_added, _null_if_sentinel(t.date_completed),
+               _null_if_sentinel(t.recurrence), t.parent_id,
+               _null_if_sentinel(t.alias)) for t in todos]
+    try:
+        cursor.executemany(_INSERT_TODO_SQL, params)
+        conn.commit()
+        return len(params)
+    except sqlite3.IntegrityError as e:
+        conn.rollback()
+        if "UNIQUE constraint failed: todos.alias" in str(e):
+            print("[red]Error: An item with a duplicate alias already exists. Please choose a different alias.[/red]")
         else:
+            print(f"[red]Database Error: {e}[/red]")
+        return 0
+
+_UPDATABLE_FIELDS = ("task", "priority", "due_date", "status", "date_completed",
+                     "recurrence", "parent_id", "alias")
+
+# One fixed statement instead of SQL assembled per call; the leading flag of
+# each CASE pair says whether to overwrite the column, so "not supplied" and
+# "explicitly set to NULL" stay distinguishable.
+_UPDATE_TODO_SET = "UPDATE todos SET " + ", ".join(
+    f"{field} = CASE WHEN ? THEN ? ELSE {field} END" for field in _UPDATABLE_FIELDS
+)
+_UPDATE_TODO_SQL = _UPDATE_TODO_SET + " WHERE id = ?"
+
+def _update_values(kwargs: Any) -> Tuple[List[Any], int]:
+    """Builds the flag/value pairs for the CASE-based UPDATE statements."""
+    values: List[Any] = []
+    supplied = 0
+    for field in _UPDATABLE_FIELDS:
+        if field in kwargs:
+            values.extend((1, _null_if_sentinel(kwargs[field])))
+            supplied += 1
+        else:
+            values.extend((0, None))
+    for key in kwargs:
+        if key not in _UPDATABLE_FIELDS:
             print(f"[yellow]Warning: Attempted to update non-existent or restricted field: {key}[/yellow]")
-            continue
+    return values, supplied
+
+def update_todo(todo_id: int, **kwargs: Any) -> bool:
+    """Updates one or more fields of an existing ToDo."""
+    values, supplied = _update_values(kwargs)
 
-    if not set_clauses: 
-        conn.close()
+    # Bail out before touching the connection: an empty update has nothing
+    # to execute, so it should not cost a cursor either.
+    if not supplied:
         return False
 
-    values.append(todo_id) 
-    
+    values.append(todo_id)
+
+    conn = get_db_connection()
+    cursor = conn.cursor()
     try:
-        cursor.execute(f"UPDATE todos SET {', '.join(set_clauses)} WHERE id = ?", values)
+        cursor.execute(_UPDATE_TODO_SQL, values)
         conn.commit()
         return cursor.rowcount > 0
     except sqlite3.IntegrityError as e:
@@ -109,8 +330,29 @@ def update_todo(todo_id: int, **kwargs: Any) -> bool:
         else:
             print(f"[red]Database Error: {e}[/red]")
         return False
-    finally:
-        conn.close()
+
+def update_todos_bulk(todo_ids: List[int], **kwargs: Any) -> int:
+    """Applies the same field updates to several ToDos in one statement.
+
+    Used when a parent's priority/recurrence changes propagate to its
+    children: one UPDATE and one commit instead of a round trip and fsync
+    per child. Returns the number of rows updated.
+    """
+    values, supplied = _update_values(kwargs)
+    if not supplied or not todo_ids:
+        return 0
+
+    placeholders = ", ".join("?" for _ in todo_ids)
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute(_UPDATE_TODO_SET + f" WHERE id IN ({placeholders})",
+                       values + list(todo_ids))
+        conn.commit()
+        return cursor.rowcount
+    except sqlite3.IntegrityError as e:
+        print(f"[red]Database Error: {e}[/red]")
+        return 0
 
 def delete_todo(todo_id: int) -> bool:
     """Deletes a ToDo from the database."""
@@ -118,37 +360,98 @@ def delete_todo(todo_id: int) -> bool:
     cursor = conn.cursor()
     cursor.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
     conn.commit()
-    conn.close()
     return cursor.rowcount > 0
 
-def complete_todo(todo_id: int) -> bool:
-    """Marks a ToDo as complete and sets the completion date."""
+# Shared by complete_todo and set_status so both call sites hit the same
+# prepared statement in the connection's cache.
+_SET_STATUS_SQL = "UPDATE todos SET status = ?, date_completed = ? WHERE id = ?"
+
+def complete_todo(todo_id: int, today_iso: Optional[str] = None) -> bool:
+    """Marks a ToDo as complete and sets the completion date.
+
+    Bulk callers can pass today's ISO date once instead of having it
+    recomputed per row.
+    """
     conn = get_db_connection()
     cursor = conn.cursor()
-    date_completed = datetime.now().date().isoformat()
-    cursor.execute("UPDATE todos SET status = ?, date_completed = ? WHERE id = ?", ("done", date_completed, todo_id))
+    date_completed = today_iso or _today_iso()
+    cursor.execute(_SET_STATUS_SQL, ("done", date_completed, todo_id))
     conn.commit()
-    conn.close()
     return cursor.rowcount > 0
 
-def set_status(todo_id: int, status: str) -> bool:
+def set_status(todo_id: int, status: str, today_iso: Optional[str] = None) -> bool:
     """Sets the status of a ToDo item."""
     conn = get_db_connection()
     cursor = conn.cursor()
-    date_completed = datetime.now().date().isoformat() if status == "done" else None
-    cursor.execute("UPDATE todos SET status = ?, date_completed = ? WHERE id = ?", (status, date_completed, todo_id))
+    if status == "done":
+        date_completed = today_iso or _today_iso()
+    else:
+        date_completed = None
+    cursor.execute(_SET_STATUS_SQL, (status, date_completed, todo_id))
     conn.commit()
-    conn.close()
     return cursor.rowcount > 0
 
+def iter_all_todos():
+    """Yields every ToDo, streaming rows as SQLite pages them in.
+
+    Callers that filter most rows away avoid materializing the full result
+    list first; get_all_todos keeps the list-returning interface.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {_COLS} FROM todos")
+    for row in cursor:
+        yield _make_todo(row)
+
 def get_all_todos() -> List[Todo]:
     """Retrieves all ToDo items from the database."""
+    return list(iter_all_todos())
+
+def get_monthly_completion_counts(ym_prefix: str) -> Dict[str, int]:
+    """Returns {iso_date: completed_count} for done todos in a YYYY-MM month.
+
+    The grouping runs inside SQLite, so the stats dashboard gets back just
+    the per-day totals instead of every row.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT date_completed, COUNT(*) FROM todos
+        WHERE status = 'done' AND date_completed LIKE ? || '%'
+        GROUP BY date_completed
+    """, (ym_prefix,))
+    return {
+        (d if isinstance(d, str) else d.isoformat()): count
+        for d, count in cursor.fetchall()
+    }
+
+def get_todos_for_today(today_iso: str) -> List[Todo]:
+    """Retrieves the rows the daily list could possibly display.
+
+    Candidates are non-archived rows due today or carrying a recurrence,
+    plus their ancestor chains (the recursive CTE pulls parents in so the
+    tree renders intact). Python still applies the exact recurrence
+    semantics; everything else — old dated tasks, archived rows — never
+    leaves SQLite.
+    """
     conn = get_db_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM todos")
-    rows = cursor.fetchall()
-    conn.close()
-    return [Todo(**row) for row in rows]
+    cursor.execute(f"""
+        WITH RECURSIVE candidates(id) AS (
+            SELECT id FROM todos
+             WHERE status != 'archived'
+               AND (due_date = ? OR recurrence IS NOT NULL)
+            UNION
+            SELECT t.parent_id FROM todos t
+              JOIN candidates c ON t.id = c.id
+             WHERE t.parent_id IS NOT NULL
+        )
+        SELECT {_COLS_T} FROM todos t
+          JOIN candidates c ON t.id = c.id
+         WHERE t.status != 'archived'
+         ORDER BY t.id
+    """, (today_iso,))
+    return [_make_todo(row) for row in cursor]
 
 def search_todos(keyword: str) -> List[Todo]:
     """
@@ -156,11 +459,35 @@ def search_todos(keyword: str) -> List[Todo]:
     """
     conn = get_db_connection()
     cursor = conn.cursor()
-    
+
+    # "search 42" is far more often an id lookup than a text query; try the
+    # primary key first and only fall through to the text scan on a miss.
+    if keyword.isdigit():
+        cursor.execute(f"SELECT {_COLS} FROM todos WHERE id = ?", (int(keyword),))
+        row = cursor.fetchone()
+        if row:
+            return [_make_todo(row)]
+
+    if _FTS_ENABLED:
+        # Quote each term and match it as a prefix, so user input cannot be
+        # misread as FTS query syntax.
+        match = " ".join(
+            '"' + term.replace('"', '""') + '"*' for term in keyword.split())
+        if match:
+            try:
+                cursor.execute(f"""
+                    SELECT {_COLS_T} FROM todos t
+                    JOIN todos_fts f ON t.id = f.rowid
+                    WHERE todos_fts MATCH ?
+                """, (match,))
+                return [_make_todo(row) for row in cursor]
+            except sqlite3.OperationalError:
+                pass  # unexpected query syntax; fall back to the LIKE scan
+
     keyword_like = f"%{keyword.lower()}%"
-    
-    cursor.execute("""
-        SELECT * FROM todos
+
+    cursor.execute(f"""
+        SELECT {_COLS} FROM todos
         WHERE LOWER(task) LIKE ? OR
               LOWER(priority) LIKE ? OR
               LOWER(status) LIKE ? OR
@@ -168,18 +495,14 @@ def search_todos(keyword: str) -> List[Todo]:
               LOWER(alias) LIKE ?
     """, (keyword_like, keyword_like, keyword_like, keyword_like, keyword_like))
     
-    rows = cursor.fetchall()
-    conn.close()
-    return [Todo(**row) for row in rows]
+    return [_make_todo(row) for row in cursor]
 
 def get_children_of_todo(parent_id: int) -> List[Todo]:
     """Retrieves all immediate children of a given parent ToDo."""
     conn = get_db_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT * FROM todos WHERE parent_id = ?", (parent_id,))
-    rows = cursor.fetchall()
-    conn.close()
-    return [Todo(**row) for row in rows]
+    cursor.execute(f"SELECT {_COLS} FROM todos WHERE parent_id = ?", (parent_id,))
+    return [_make_todo(row) for row in cursor]
 
 def get_todo_by_id_or_alias(identifier: Union[int, str]) -> Optional[Todo]:
     conn = get_db_connection()
@@ -187,19 +510,19 @@ def get_todo_by_id_or_alias(identifier: Union[int, str]) -> Optional[Todo]:
 
     row = None
     if isinstance(identifier, int) or (isinstance(identifier, str) and identifier.isdigit()):
-        cursor.execute("SELECT * FROM todos WHERE id = ?", (int(identifier),))
+        cursor.execute(f"SELECT {_COLS} FROM todos WHERE id = ?", (int(identifier),))
         row = cursor.fetchone()
     else:
-
-        cursor.execute("SELECT * FROM todos WHERE alias = ?", (identifier,))
+        # One statement covers both lookups; the ORDER BY flag ranks an
+        # alias hit above a task-name hit, so the old "alias first, then
+        # task" fallback no longer costs a second round trip.
+        cursor.execute(f"""
+            SELECT {_COLS} FROM todos WHERE alias = ? OR task = ?
+            ORDER BY (alias = ?) DESC LIMIT 1
+        """, (identifier, identifier, identifier))
         row = cursor.fetchone()
 
-        if not row:
-            cursor.execute("SELECT * FROM todos WHERE task = ?", (identifier,))
-            row = cursor.fetchone()
-
-    conn.close()
-    return Todo(**row) if row else None
+    return _make_todo(row) if row else None
 
 
 def get_todo_by_path_string(path_string: str, all_todos: List[Todo]) -> Optional[Todo]:
@@ -211,18 +534,27 @@ def get_todo_by_path_string(path_string: str, all_todos: List[Todo]) -> Optional
     current_parent_id = None
     target_todo = None
 
-    for i, part in enumerate(parts):
+    # One pass to group by parent, then each path segment is a dict lookup
+    # instead of rescanning the full list.
+    children_by_parent: Dict[Optional[int], List[Todo]] = {}
+    for t in all_todos:
+        children_by_parent.setdefault(t.parent_id, []).append(t)
+
+    for part in parts:
         found_in_step = None
-        potential_todos = [t for t in all_todos if t.parent_id == current_parent_id]
+        potential_todos = children_by_parent.get(current_parent_id, [])
+        # Aliases are stored lowercase and _task_lc is precomputed on the
+        # model, so each candidate costs one string compare.
+        part_lc = part.lower()
 
         for todo in potential_todos:
-            if todo.alias and todo.alias.lower() == part.lower():
+            if todo.alias and todo.alias == part_lc:
                 found_in_step = todo
                 break
-        
+
         if not found_in_step:
             for todo in potential_todos:
-                if todo.task.lower() == part.lower():
+                if todo._task_lc == part_lc:
                     found_in_step = todo
                     break
         
@@ -238,73 +570,58 @@ def refresh_all_recurring_tasks() -> int:
     """
     Archives old recurring tasks and creates fresh instances for today.
     Returns number of tasks refreshed.
+
+    One SELECT decides which rows are due, one set-oriented UPDATE archives
+    them all, and one executemany inserts the fresh copies — two statements
+    instead of two per row.
     """
-    from .model import Todo
     conn = get_db_connection()
     cursor = conn.cursor()
-    today = datetime.today().date()
+    today = date.today()
     today_iso = today.isoformat()
+    today_week = today.isocalendar()[1]
+    today_month = today.month
 
+    # ISO dates order lexicographically, so a plain comparison works and,
+    # unlike date(date_added), can use the index on the column.
     cursor.execute("""
-        SELECT * FROM todos
+        SELECT task, priority, recurrence, parent_id, alias, date_added
+        FROM todos
         WHERE recurrence IN ('daily', 'weekly', 'monthly')
-          AND date(date_added) < ?
+          AND date_added < ?
     """, (today_iso,))
     old_tasks = cursor.fetchall()
 
-    refreshed_count = 0
-
-    for row in old_tasks:
-        old = dict(row)
+    new_rows = []
+    for old in old_tasks:
         recurrence = old["recurrence"]
-        date_added = datetime.fromisoformat(old["date_added"]).date()
+        added = old["date_added"]
 
         if recurrence == "daily":
             should_create = True
         elif recurrence == "weekly":
-            should_create = today.isocalendar()[1] != date_added.isocalendar()[1]
-        elif recurrence == "monthly":
-            should_create = today.month != date_added.month
-        else:
-            should_create = False
-
-        cursor.execute("UPDATE todos SET status = 'archived' WHERE id = ?", (old["id"],))
+            added_date = added if isinstance(added, date) else _parse_iso_date(added)
+            should_create = today_week != added_date.isocalendar()[1]
+        else:  # monthly
+            added_month = added.month if isinstance(added, date) else int(added[5:7])
+            should_create = today_month != added_month
 
         if should_create:
-            new_task = Todo(
-                task=old["task"],
-                priority=old["priority"],
-                due_date=None,
-                status="pending",
-                date_added=today_iso,
-                date_completed=None,
-                recurrence=recurrence,
-                parent_id=old["parent_id"],
-                alias=old["alias"]
-            )
-
-            cursor.execute("""
-                INSERT INTO todos (
-                    task, priority, due_date, status, date_added,
-                    date_completed, recurrence, parent_id, alias
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                new_task.task,
-                new_task.priority,
-                new_task.due_date,
-                new_task.status,
-                new_task.date_added,
-                new_task.date_completed,
-                new_task.recurrence,
-                new_task.parent_id,
-                new_task.alias
-            ))
-
-            refreshed_count += 1
+            new_rows.append((old["task"], old["priority"], None, "pending",
+                             today_iso, None, recurrence, old["parent_id"],
+                             old["alias"]))
 
+    # The fresh copies carry today's date_added, so they cannot match the
+    # archive predicate regardless of statement order.
+    cursor.execute("""
+        UPDATE todos SET status = 'archived'
+        WHERE recurrence IN ('daily', 'weekly', 'monthly')
+          AND date_added < ?
+    """, (today_iso,))
+    if new_rows:
+        cursor.executemany(_INSERT_TODO_SQL, new_rows)
     conn.commit()
-    conn.close()
-    return refreshed_count
+    return len(new_rows)
 
 
 
@@ -312,15 +629,14 @@ def delete_past_due_todos() -> int:
     """Deletes non-recurring tasks whose due_date is before today."""
     conn = get_db_connection()
     cursor = conn.cursor()
-    today = datetime.today().date().isoformat()
+    today = _today_iso()
 
     cursor.execute("""
         DELETE FROM todos
         WHERE due_date IS NOT NULL
-          AND date(due_date) < ?
+          AND due_date < ?
           AND (recurrence IS NULL OR recurrence = '' OR recurrence = 'none')
     """, (today,))
     deleted_count = cursor.rowcount
     conn.commit()
-    conn.close()
     return deleted_count
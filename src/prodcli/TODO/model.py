@@ -1,7 +1,13 @@
 # TODO/model.py
 from dataclasses import dataclass, field
 from typing import Optional
-from datetime import datetime
+import time
+
+# Validation sets built once at import; __post_init__ runs for every row
+# hydrated from the database, so per-instance list literals add up.
+_STATUSES = frozenset({"pending", "in-progress", "done", "archived"})
+_PRIORITIES = frozenset({"low", "medium", "high"})
+_RECURRENCES = frozenset({"daily", "weekly", "monthly", "none"})
 
 @dataclass
 class Todo:
@@ -9,7 +15,7 @@ class Todo:
     priority: str = "medium"  # default: "low", "medium", "high"
     due_date: Optional[str] = None
     status: str = "pending"   # default: "pending", "in-progress", "done"
-    date_added: str = field(default_factory=lambda: datetime.now().date().isoformat())
+    date_added: str = field(default_factory=lambda: time.strftime("%Y-%m-%d"))
     date_completed: Optional[str] = None
     recurrence: Optional[str] = None # Renamed from 'repeat' in model for clarity, but DB column is 'repeat'
     id: Optional[int] = None # Added 'id' to capture database primary key
@@ -17,29 +23,36 @@ class Todo:
     alias: Optional[str] = None # NEW: Optional shortcode/alias for the task
 
     def __post_init__(self):
-        self.status = self.status.lower().strip()
-        if self.status not in ["pending", "in-progress", "done", "archived"]:
-            self.status = "pending"
-
+        # Rows hydrated from the database are already canonical, so the
+        # membership test alone passes them through; the allocating
+        # lower/strip path only runs for raw user input.
+        if self.status not in _STATUSES:
+            self.status = self.status.lower().strip()
+            if self.status not in _STATUSES:
+                self.status = "pending"
 
-        self.priority = self.priority.lower().strip()
-        if self.priority not in ["low", "medium", "high"]:
-            self.priority = "medium" 
+        if self.priority not in _PRIORITIES:
+            self.priority = self.priority.lower().strip()
+            if self.priority not in _PRIORITIES:
+                self.priority = "medium"
 
-
-        if self.recurrence:
+        if self.recurrence and self.recurrence not in _RECURRENCES:
             self.recurrence = self.recurrence.lower().strip()
-            if self.recurrence not in ["daily", "weekly", "monthly", "none"]:
-                self.recurrence = None 
+            if self.recurrence not in _RECURRENCES:
+                self.recurrence = None
         
        
         if self.alias:
-            self.alias = self.alias.strip().lower().replace(" ", "-") 
-            if not self.alias: 
+            self.alias = self.alias.strip().lower().replace(" ", "-")
+            if not self.alias:
                 self.alias = None
         else:
             self.alias = None
 
+        # Case-insensitive lookups compare against this precomputed key
+        # instead of re-lowering the task string per comparison.
+        self._task_lc = self.task.lower()
+
 
     def __repr__(self):
         return (f"Todo(id={self.id}, task='{self.task}', priority='{self.priority}', "
@@ -4,16 +4,15 @@ from rich.console import Console
 from rich.table import Table
 from rich.text import Text
 from rich import box # For better table borders
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional, List
-from collections import defaultdict
 from prodcli.TODO.database import delete_past_due_todos, refresh_all_recurring_tasks
-from prodcli.TODO.database import get_all_todos
 from prodcli.TODO.database import get_children_of_todo, update_todo
 from prodcli.TODO.model import Todo
 from prodcli.TODO.database import (
-    create_tables, insert_todo, get_all_todos, delete_todo,
-    update_todo, complete_todo, set_status, search_todos, get_children_of_todo,
+    create_tables, insert_todo, get_todos_for_today, delete_todo,
+    update_todo, update_todos_bulk, complete_todo, set_status, search_todos, get_children_of_todo,
     get_todo_by_id_or_alias 
 )
 
@@ -21,6 +20,37 @@ console = Console()
 
 todo_app = typer.Typer(help="A powerful command-line ToDo list application.")
 
+# Shared by the list and search renderers; built once at import instead of
+# re-running the same if/elif ladder (and allocating the same Text) per row.
+_PRIORITY_STYLE = {"high": "bold red", "medium": "yellow", "low": "green"}
+_STATUS_TEXT = {
+    "done": Text("✔ Done", style="green"),
+    "in-progress": Text("In Progress", style="blue"),
+    "pending": Text("Pending", style="white"),
+}
+_OVERDUE_TEXT = Text("Overdue", style="red bold")
+
+# Recurrence semantics dispatched by value rather than an if/elif chain
+# re-run per todo; anything unknown (including None and "none") simply
+# has no entry and is treated as not recurring.
+_RECURRENCE_CHECKS = {
+    "daily": lambda start, current: True,
+    "weekly": lambda start, current:
+        current - timedelta(days=current.weekday())
+        >= start - timedelta(days=start.weekday()),
+    "monthly": lambda start, current: current.day == start.day,
+}
+
+def is_recurring_today(todo: Todo, current_date: date) -> bool:
+    """True when a recurring task has an occurrence on current_date."""
+    check = _RECURRENCE_CHECKS.get(todo.recurrence)
+    if check is None:
+        return False
+    task_start_date = todo._added
+    if task_start_date is None or current_date < task_start_date:
+        return False
+    return check(task_start_date, current_date)
+
 @todo_app.callback()
 def todo_main_callback():
     """
@@ -30,15 +60,106 @@ def todo_main_callback():
     create_tables()
 
 
+@lru_cache(maxsize=2048)
 def short_date(date_str: Optional[str]) -> str:
-    """Convert ISO datetime to DD-MM-YYYY format, handles None/string 'None' gracefully."""
-    if date_str is None or date_str == 'None':
+    """Convert an ISO date/datetime string to DD-MM-YYYY, handles None gracefully.
+
+    Stored values are ISO, so this is pure slicing — no datetime object is
+    ever built; anything non-ISO is returned as-is like before.
+    """
+    if date_str is None:
         return "-"
-    try:
-        dt = datetime.fromisoformat(date_str)
-        return dt.strftime("%d-%m-%Y")
-    except ValueError:
-        return date_str 
+    if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+        return f"{date_str[8:10]}-{date_str[5:7]}-{date_str[0:4]}"
+    return date_str
+
+
+def _build_todo_table(title: str) -> Table:
+    """Creates the seven-column table shared by the list and search views."""
+    table = Table(
+        title=title,
+        show_header=True,
+        header_style="bold magenta",
+        box=box.ROUNDED,
+        show_lines=True
+    )
+    table.add_column("ID / Alias", justify="center", style="dim")
+    table.add_column("Task", justify="left")
+    table.add_column("Due Date", justify="center")
+    table.add_column("Priority", justify="center")
+    table.add_column("Status", justify="center")
+    table.add_column("Added Date", justify="center")
+    table.add_column("Repeat", justify="center")
+    return table
+
+
+def _add_todo_rows(table: Table, tasks: List[Todo], children_map: dict,
+                   today_date: date, level: int = 0, show_ids: bool = False):
+    """Adds a task subtree to the table, one row per task, depth first.
+
+    The list view marks rows with bullets (show_ids=False); the search
+    view shows ids/aliases and blanks due date, priority and repeat on
+    child rows.
+    """
+    for task in tasks:
+        indent = "  " * level
+        task_text = f"{indent}{task.task}"
+        row_style = ""
+        status_text = _STATUS_TEXT.get(task.status) or Text(task.status.capitalize(), style="white")
+
+        if task.status == "done":
+            row_style = "strike dim"
+        elif task.status == "pending":
+            # _due is pre-parsed at the data layer (None when absent or
+            # malformed), so no try/except is needed per row.
+            if task._due is not None and task._due < today_date:
+                row_style = "red bold"
+                status_text = _OVERDUE_TEXT
+
+        priority_style = _PRIORITY_STYLE.get(task.priority, "white")
+
+        if show_ids:
+            id_alias_display = str(task.id)
+            if task.alias:
+                id_alias_display += f" ({task.alias})"
+            if task.parent_id:
+                id_alias_display = f"{indent}↳ {id_alias_display}"
+            hide_meta = bool(task.parent_id)
+        else:
+            id_alias_display = f"{indent}↳" if task.parent_id else "•"
+            hide_meta = False
+
+        due_display = short_date(task.due_date) if task.due_date and not hide_meta else "-"
+        priority_display = task.priority.capitalize() if not hide_meta else "-"
+        repeat_display = (task.recurrence or "-") if not hide_meta else "-"
+
+        # Most rows carry no row-level style; bare strings skip the Text
+        # allocation rich would otherwise make per cell.
+        if row_style:
+            table.add_row(
+                Text(id_alias_display, style=row_style),
+                Text(task_text, style=row_style),
+                Text(due_display, style=row_style),
+                Text(priority_display, style=priority_style),
+                status_text,
+                Text(short_date(task.date_added), style=row_style),
+                Text(repeat_display, style=row_style)
+            )
+        else:
+            table.add_row(
+                id_alias_display,
+                task_text,
+                due_display,
+                Text(priority_display, style=priority_style),
+                status_text,
+                short_date(task.date_added),
+                repeat_display
+            )
+
+        children = children_map.get(task.id)
+        if children:
+            _add_todo_rows(table, children, children_map, today_date,
+                           level + 1, show_ids)
 
 
 @todo_app.command("add")
@@ -54,7 +175,7 @@ def add_todo(
     """Add a new ToDo item."""
     if due_date:
         try:
-            datetime.fromisoformat(due_date).date()
+            date.fromisoformat(due_date)
         except ValueError:
             console.print("[red]Error: Due date must be in YYYY-MM-DD format.[/red]")
             raise typer.Exit(code=1)
@@ -76,7 +197,7 @@ def add_todo(
         priority=priority,
         due_date=due_date,
         status=status,
-        date_added=datetime.now().date().isoformat(),
+        date_added=date.today().isoformat(),
         recurrence=recurrence,
         parent_id=parent_id,
         alias=alias
@@ -92,37 +213,16 @@ def list_todos():
     Only shows tasks that are pending or in-progress and due today,
     or recurring tasks relevant for today that are not yet done.
     """
-    all_todos = [t for t in get_all_todos() if t.status != "archived"]
-    today_iso = datetime.now().date().isoformat()
-    today_date = datetime.now().date()
+    today_date = date.today()
+    today_iso = today_date.isoformat()
+    all_todos = get_todos_for_today(today_iso)
 
-    filtered_todos = []
-    children_map = defaultdict(list)
-    
-    # Helper to check if a recurring task is relevant for today
-    def is_recurring_today(todo: Todo, current_date: datetime.date) -> bool:
-        if not todo.recurrence:
-            return False
-        
-        task_start_date = datetime.fromisoformat(todo.date_added).date()
-        if current_date < task_start_date:
-            return False
-
-        if todo.recurrence == "daily":
-            return True
-        elif todo.recurrence == "weekly":
-            start_of_task_week = task_start_date - timedelta(days=task_start_date.weekday())
-            start_of_current_week = current_date - timedelta(days=current_date.weekday())
-            return start_of_current_week >= start_of_task_week
-        elif todo.recurrence == "monthly":
-            return current_date.day == task_start_date.day
-        return False
-
-    temp_children_map = defaultdict(list)
-    for todo in all_todos:
-        temp_children_map[todo.parent_id].append(todo)
+    by_id = {todo.id: todo for todo in all_todos}
 
-    display_todo_ids = set()
+    # A dict keyed by id dedupes the same way a seen-set would, and ancestors
+    # are reached through by_id lookups instead of rescanning the whole list
+    # for every hop up the parent chain.
+    display_todos = {}
 
     for todo in all_todos:
         should_display = False
@@ -133,105 +233,27 @@ def list_todos():
             should_display = True
 
         if should_display:
-            display_todo_ids.add(todo.id)
-            if todo.parent_id: 
-                current_id = todo.id
-                while current_id is not None:
-                    parent_id = None
-                    for t in all_todos:
-                        if t.id == current_id and t.parent_id is not None:
-                            parent_id = t.parent_id
-                            break
-                    if parent_id is not None:
-                        display_todo_ids.add(parent_id)
-                        current_id = parent_id
-                    else:
-                        current_id = None 
+            display_todos[todo.id] = todo
+            parent = by_id.get(todo.parent_id)
+            while parent is not None and parent.id not in display_todos:
+                display_todos[parent.id] = parent
+                parent = by_id.get(parent.parent_id)
 
-    for todo in all_todos:
-        if todo.id in display_todo_ids:
-            filtered_todos.append(todo)
-            children_map[todo.parent_id].append(todo)
-    
-    if not filtered_todos:
+    if not display_todos:
         console.print("[yellow]No ToDo items for today.[/yellow]")
         return
 
-    for parent_id in children_map:
-        children_map[parent_id].sort(key=lambda t: t.id if t.id is not None else float('inf'))
-
-    table = Table(
-        title=f"[bold cyan]Your ToDo List for Today ({today_iso})[/bold cyan]",
-        show_header=True,
-        header_style="bold magenta",
-        box=box.ROUNDED,
-        show_lines=True
-    )
-    table.add_column("ID / Alias", justify="center", style="dim")
-    table.add_column("Task", justify="left")
-    table.add_column("Due Date", justify="center")
-    table.add_column("Priority", justify="center")
-    table.add_column("Status", justify="center")
-    table.add_column("Added Date", justify="center")
-    table.add_column("Repeat", justify="center")
-
-    def add_task_rows_recursive(tasks: List[Todo], level: int = 0):
-        for task in tasks:
-            indent = "  " * level
-            task_text = f"{indent}{task.task}"
-            row_style = ""
-            status_text = Text(task.status.capitalize(), style="white")
-            priority_style = "white" 
-
-            if task.status == "done":
-                row_style = "strike dim"
-                status_text = Text("✔ Done", style="green")
-            elif task.status == "in-progress":
-                status_text = Text("In Progress", style="blue")
-            elif task.status == "pending":
-                if task.due_date:
-                    try:
-                        if datetime.fromisoformat(task.due_date).date() < datetime.now().date():
-                            row_style = "red bold"
-                            status_text = Text("Overdue", style="red bold")
-                    except ValueError:
-                        pass 
-
-            if task.priority == "high":
-                priority_style = "bold red"
-            elif task.priority == "medium":
-                priority_style = "yellow"
-            elif task.priority == "low":
-                priority_style = "green"
-            
-            safe_priority = task.priority.capitalize() if task.priority else "Medium"
-
-
-            if task.parent_id:
-                id_alias_display = f"{indent}↳"
-            else:
-                id_alias_display = "•"
-            priority_display = safe_priority
-            due_display = short_date(task.due_date) if task.due_date else "-"
-            repeat_display = task.recurrence or "-"
-
-
+    # One bucketing pass in database order; display_todos doubles as the
+    # emptiness check, so no separate filtered list is accumulated.
+    # get_todos_for_today returns rows ORDER BY id, so each bucket is
+    # already in id order and needs no re-sort.
+    children_map = {}
+    for todo in all_todos:
+        if todo.id in display_todos:
+            children_map.setdefault(todo.parent_id, []).append(todo)
 
-            table.add_row(
-                Text(id_alias_display, style=row_style), 
-                Text(task_text, style=row_style),
-                Text(due_display, style=row_style),
-                Text(priority_display, style=priority_style),
-                status_text,
-                Text(short_date(task.date_added), style=row_style),
-                Text(repeat_display, style=row_style)
-            )
-            
-            if task.id in children_map and children_map[task.id]:
-                add_task_rows_recursive(children_map[task.id], level + 1)
-    
-    top_level_tasks = children_map[None]
-    add_task_rows_recursive(top_level_tasks)
+    table = _build_todo_table(f"[bold cyan]Your ToDo List for Today ({today_iso})[/bold cyan]")
+    _add_todo_rows(table, children_map.get(None, []), children_map, today_date)
 
     console.print(table)
 
@@ -263,7 +285,7 @@ def update_todo_command(
             update_params["due_date"] = None
         else:
             try:
-                datetime.fromisoformat(due_date).date()
+                date.fromisoformat(due_date)
                 update_params["due_date"] = due_date
             except ValueError:
                 console.print("[red]Error: Due date must be in YYYY-MM-DD format or 'none'.[/red]")
@@ -296,20 +318,12 @@ def update_todo_command(
         update_todo(todo_obj.id, **update_params)
         console.print(f"[green]ToDo '{identifier}' updated successfully.[/green]")
 
-        updated_fields = {"priority", "recurrence"}
-        if updated_fields.intersection(update_params.keys()):
+        child_updates = {field: update_params[field]
+                         for field in ("priority", "recurrence") if field in update_params}
+        if child_updates:
             children = get_children_of_todo(todo_obj.id)
             if children:
-                for child in children:
-                    child_updates = {}
-                    if "priority" in update_params:
-                        child_updates["priority"] = update_params["priority"]
-                    if "recurrence" in update_params:
-                        child_updates["recurrence"] = update_params["recurrence"]
-
-                    if child_updates:
-                        update_todo(child.id, **child_updates)
-
+                update_todos_bulk([child.id for child in children], **child_updates)
                 console.print(f"[yellow]{len(children)} child task(s) updated to match parent.[/yellow]")
     else:
         console.print("[yellow]No updates provided.[/yellow]")
@@ -393,82 +407,16 @@ def search_todos_command(keyword: str = typer.Argument(..., help="Keyword to sea
     # Reuse list_todos's rendering logic (or part of it) for search results
     console.print(f"[bold blue]Search Results for '{keyword}':[/bold blue]")
     
-    table = Table(
-        title=f"[bold cyan]Search Results for '{keyword}'[/bold cyan]",
-        show_header=True,
-        header_style="bold magenta",
-        box=box.ROUNDED,
-        show_lines=True
-    )
-    table.add_column("ID / Alias", justify="center", style="dim")
-    table.add_column("Task", justify="left")
-    table.add_column("Due Date", justify="center")
-    table.add_column("Priority", justify="center")
-    table.add_column("Status", justify="center")
-    table.add_column("Added Date", justify="center")
-    table.add_column("Repeat", justify="center")
+    table = _build_todo_table(f"[bold cyan]Search Results for '{keyword}'[/bold cyan]")
 
-    children_map = defaultdict(list)
-    for todo in results: 
-        children_map[todo.parent_id].append(todo)
-
-    def add_task_rows_recursive_search(tasks: List[Todo], level: int = 0):
-        for task in tasks:
-            indent = "  " * level
-            task_text = f"{indent}{task.task}"
-            row_style = ""
-            status_text = Text(task.status.capitalize(), style="white")
-            priority_style = "white"
-
-            if task.status == "done":
-                row_style = "strike dim"
-                status_text = Text("✔ Done", style="green")
-            elif task.status == "in-progress":
-                status_text = Text("In Progress", style="blue")
-            elif task.status == "pending":
-                if task.due_date:
-                    try:
-                        if datetime.fromisoformat(task.due_date).date() < datetime.now().date():
-                            row_style = "red bold"
-                            status_text = Text("Overdue", style="red bold")
-                    except ValueError:
-                        pass
-
-            if task.priority == "high":
-                priority_style = "bold red"
-            elif task.priority == "medium":
-                priority_style = "yellow"
-            elif task.priority == "low":
-                priority_style = "green"
-            
-            safe_priority = task.priority.capitalize() if task.priority else "Medium"
+    today_date = date.today()
+    children_map = {}
+    for todo in results:
+        children_map.setdefault(todo.parent_id, []).append(todo)
 
-            id_alias_display = str(task.id)
-            if task.alias:
-                id_alias_display += f" ({task.alias})"
-            if task.parent_id:
-                id_alias_display = f"{indent}↳ {id_alias_display}"
-
-            due_display = short_date(task.due_date) if task.due_date and not task.parent_id else "-"
-            priority_display = safe_priority if not task.parent_id else "-"
-            repeat_display = task.recurrence or "-" if not task.parent_id else "-"
-
-            table.add_row(
-                Text(id_alias_display, style=row_style),
-                Text(task_text, style=row_style),
-                Text(due_display, style=row_style),
-                Text(priority_display, style=priority_style),
-                status_text,
-                Text(short_date(task.date_added), style=row_style),
-                Text(repeat_display, style=row_style)
-            )
-            
-        
-            if task.id in children_map and children_map[task.id]:
-                add_task_rows_recursive_search(children_map[task.id], level + 1)
-    
     top_level_search_results = [t for t in results if t.parent_id is None]
-    add_task_rows_recursive_search(top_level_search_results)
+    _add_todo_rows(table, top_level_search_results, children_map, today_date,
+                   show_ids=True)
 
     console.print(table)
 
@@ -7,7 +7,7 @@ from prodcli.LEARNING.learning_app import learning_app
 from prodcli.TODO.dashboard import dashboard_app
 import threading
 import time
-from plyer import notification
+import os
 import sys
 
 app = typer.Typer()
@@ -20,6 +20,11 @@ app.add_typer(learning_app, name="learning", help="Track your coding problems an
 
 
 def show_reminder():
+    # plyer probes platform notification backends on import, which is too
+    # expensive to pay on every CLI start; load it only when a reminder
+    # actually fires.
+    from plyer import notification
+
     notification.notify(
         title="⏰ Reminder",
         message="Don't forget to check or update your ToDo tasks!",
@@ -34,8 +39,10 @@ def reminder_loop():
 
 @app.callback()
 def main_callback():
-   # Start the background reminder thread only once
-    if not hasattr(main_callback, 'reminder_thread_started'):
+    # One-shot commands exit in milliseconds, long before the three-hourly
+    # reminder could ever fire, so only a deliberately long-lived invocation
+    # (PRODCLI_DAEMON=1) pays for the background thread.
+    if os.environ.get("PRODCLI_DAEMON") and not hasattr(main_callback, 'reminder_thread_started'):
         threading.Thread(target=reminder_loop, daemon=True).start()
         main_callback.reminder_thread_started = True
 